@@ -62,11 +62,11 @@ from ui.icons import (
 from ui.nav_dock import (
     build_nav_dock,
     decorate_nav_item,
-    make_nav_item_widget,
+    decorate_nav_items,
+    flush_nav_decorations,
     nav_display_name,
 )
-from ui.overlays import position_overlays
-from ui.layout import build_ui, install_ribbon_toolbar
+from ui.layout import build_ui, ensure_ref_plotter, install_ribbon_toolbar
 from services.storage import log_gui
 
 
@@ -203,6 +203,12 @@ class Annotator(QtWidgets.QMainWindow):
     def _build_ui(self):
         return build_ui(self)
 
+    def _ensure_ref_plotter(self):
+        return ensure_ref_plotter(self)
+
+    def _add_ref_actor(self, render_points_as_spheres: bool):
+        return io.add_ref_actor(self, render_points_as_spheres)
+
     def _set_view(self, idx: int):
         return camera.set_view(self, idx)
 
@@ -224,9 +230,6 @@ class Annotator(QtWidgets.QMainWindow):
     def load_cloud(self):
         return io.load_cloud(self)
 
-    def _position_overlays(self):
-        return position_overlays(self)
-
     def _view_direction(self):
         return camera.view_direction(self)
 
@@ -290,6 +293,12 @@ class Annotator(QtWidgets.QMainWindow):
     def on_page(self, delta: int):
         return navigation.on_page(self, delta)
 
+    def _schedule_ui_refresh(self):
+        return navigation.schedule_ui_refresh(self)
+
+    def _refresh_ui(self):
+        return navigation.refresh_ui(self)
+
     def _toggle_loop(self, on: bool):
         return navigation.toggle_loop(self, on)
 
@@ -384,12 +393,18 @@ class Annotator(QtWidgets.QMainWindow):
     def _begin_batch(self):
         return camera.begin_batch(self)
 
+    def _batched(self):
+        return camera.batched(self)
+
     def _finalize_layout(self):
         return camera.finalize_layout(self)
 
     def _pre_fit_camera(self, mesh, plotter):
         return camera.pre_fit_camera(self, mesh, plotter)
 
+    def _pre_fit_camera_from_bounds(self, bounds, plotter):
+        return camera.pre_fit_camera_from_bounds(self, bounds, plotter)
+
     def _end_batch(self):
         return camera.end_batch(self)
 
@@ -399,6 +414,9 @@ class Annotator(QtWidgets.QMainWindow):
     def _render_views_once(self):
         return camera.render_views_once(self)
 
+    def _flush_render(self):
+        return camera.flush_render(self)
+
     def _blend_into_mesh_subset(self, idx):
         return annotation.blend_into_mesh_subset(self, idx)
 
@@ -426,15 +444,18 @@ class Annotator(QtWidgets.QMainWindow):
     def _nav_display_name(self, name: str) -> str:
         return nav_display_name(self, name)
 
-    def _make_nav_item_widget(self, idx: int):
-        return make_nav_item_widget(self, idx)
-
     def _scan_annotated_files(self):
         return nav_ui.scan_annotated_files(self)
 
     def _decorate_nav_item(self, idx: int):
         return decorate_nav_item(self, idx)
 
+    def _decorate_nav_items(self, idxs):
+        return decorate_nav_items(self, idxs)
+
+    def _flush_nav(self):
+        return flush_nav_decorations(self)
+
     def _mark_dirty_once(self):
         return nav_ui.mark_dirty_once(self)
 
@@ -480,6 +501,7 @@ class Annotator(QtWidgets.QMainWindow):
 
 if __name__ == '__main__':
     sys.excepthook = _handle_exception
+    QtWidgets.QApplication.setAttribute(QtCore.Qt.AA_UseDesktopOpenGL)
     app = SafeApplication(sys.argv)
     win = Annotator()
     win.show()
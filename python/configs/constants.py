@@ -10,18 +10,23 @@ VERSION_NUMBER = "2.4.0"
 STATE_DIR = Path(user_data_dir(APP_NAME, appauthor=False))
 STATE_FILE = STATE_DIR / "state.json"
 THUMB_DIR = STATE_DIR / "thumbs"
+THUMB_INDEX_FILE = STATE_DIR / "thumb_keys.sqlite"   # persisted thumb_key memo
 
 THUMB_SIZE = 96   # pixels (safe, fast, clean)
 THUMB_MAX_PTS = 150_000   # cap for thumb generation (fast)
+THUMB_PNG_COMPRESS_LEVEL = 1   # re-derivable cache: favor encode speed over size
 PERCENTAGE_CORE_FACTOR = 0.80
 THUMB_BACKEND = "threading"
+THUMB_MIN_BATCH = 32   # smaller worker batches wait briefly for more arrivals
+THUMB_BATCH_WAIT_S = 0.05
 DEBUG_GUI_LOG = True
 GUI_LOG_MAX_BYTES = 2 * 1024 * 1024
 GUI_LOG_BACKUPS = 3
+STATE_FLUSH_DELAY_MS = 200   # coalesce save_state writes
 
 NAV_THUMB_SIZE = THUMB_SIZE
 NAV_NAME_MAX = 30
 NAV_DOCK_WIDTH = 155
 RIBBON_ENH_VIEW_HEIGHT = 88
+MSAA_SAMPLES = 4   # per-view multisampling; 0 disables (slow/software GL)
 NAV_FAST_THRESHOLD = 50000
-NAV_FAST_ICON_BATCH = 300
@@ -12,6 +12,19 @@ import matplotlib.pyplot as plt
 from controllers import app_helpers
 
 
+_RGB_ROW = np.dtype([("r", "u1"), ("g", "u1"), ("b", "u1")])
+
+
+def rgb_rows_equal(a, b):
+    """Per-point equality of two (N, 3) uint8 RGB arrays in a single compare."""
+    if (a.dtype != np.uint8 or b.dtype != np.uint8 or a.shape != b.shape
+            or a.ndim != 2 or a.shape[1] != 3):
+        return np.all(a == b, axis=1)
+    a = np.ascontiguousarray(a)
+    b = np.ascontiguousarray(b)
+    return a.view(_RGB_ROW).reshape(-1) == b.view(_RGB_ROW).reshape(-1)
+
+
 def toggle_annotation(app) -> None:
     if app.act_annotation_mode.isChecked():
         app.update_cursor()
@@ -118,15 +131,13 @@ def update_cursor(app) -> None:
     p.drawEllipse(2, 2, d, d)
     p.end()
 
-    if app.clone_mode:
+    if app.clone_mode and app.plotter_ref is not None:
         app.plotter_ref.interactor.setCursor(QCursor(pix, r_eff + 2, r_eff + 2))
         app.plotter.interactor.unsetCursor()
-    elif app.repair_mode:
-        app.plotter.interactor.setCursor(QCursor(pix, r_eff + 2, r_eff + 2))
-        app.plotter_ref.interactor.unsetCursor()
     else:
         app.plotter.interactor.setCursor(QCursor(pix, r_eff + 2, r_eff + 2))
-        app.plotter_ref.interactor.unsetCursor()
+        if app.plotter_ref is not None:
+            app.plotter_ref.interactor.unsetCursor()
 
 
 def change_brush(app, val) -> None:
@@ -158,7 +169,7 @@ def change_point(app, val) -> None:
                 prop.SetRenderPointsAsSpheres(render_points_as_spheres)
             except Exception:
                 pass
-            if not getattr(app, "_is_closing", False) and not getattr(app, "_batch", False):
+            if not app._is_closing and not app._batch:
                 render_fn()
         except Exception:
             pass
@@ -270,7 +281,7 @@ def on_undo(app) -> None:
     if hasattr(app, "toggle_ann_chk"):
         app.toggle_ann_chk.setEnabled(True)
     if not np.any(app._session_edited):
-        app._dirty.discard(app.index)
+        app._dirty[app.index] = False
         app._decorate_nav_item(app.index)
         app._update_status_bar()
         try:
@@ -320,7 +331,14 @@ def on_eraser_toggled(app, on: bool) -> None:
         app.current_color = app._last_paint_color.copy()
 
 
+def cancel_pending_gamma(app) -> None:
+    """Drop a throttled gamma update still queued from a slider drag."""
+    if hasattr(app, "ribbon_gamma_throttle"):
+        app.ribbon_gamma_throttle.cancel()
+
+
 def reset_contrast(app) -> None:
+    cancel_pending_gamma(app)
     if "gamma" in app.ribbon_sliders:
         gamma_slider, gamma_lbl = app.ribbon_sliders["gamma"]
         gamma_slider.blockSignals(True)
@@ -329,16 +347,16 @@ def reset_contrast(app) -> None:
         gamma_lbl.setText("1.00")
 
     current = app.colors.copy()
-    untouched_mask = np.all(current == app.original_colors, axis=1)
+    untouched_mask = rgb_rows_equal(current, app.original_colors)
     current[untouched_mask] = app.original_colors[untouched_mask]
     app.enhanced_colors = app.original_colors.copy()
 
     app.cloud["RGB"] = current
     update_annotation_visibility(app)
 
-    if app.repair_mode and hasattr(app, "cloud_ref"):
+    if app.repair_mode and app.cloud_ref is not None:
         app.cloud_ref["RGB"] = app.original_colors.astype(np.uint8)
-        if not getattr(app, "_is_closing", False) and not getattr(app, "_batch", False):
+        if not app._is_closing and not app._batch:
             app.plotter_ref.render()
 
 
@@ -363,19 +381,20 @@ def on_gamma_change(app, val) -> None:
     app.enhanced_colors = (corrected * 255).astype(np.uint8)
 
     current = app.colors.copy()
-    mask = np.all(current == app.original_colors, axis=1)
+    mask = rgb_rows_equal(current, app.original_colors)
     current[mask] = app.enhanced_colors[mask]
 
     app.cloud["RGB"] = current
     update_annotation_visibility(app)
 
-    if app.repair_mode and hasattr(app, "cloud_ref"):
+    if app.repair_mode and app.cloud_ref is not None:
         app.cloud_ref["RGB"] = app.original_colors.astype(np.uint8)
-        if not getattr(app, "_is_closing", False) and not getattr(app, "_batch", False):
+        if not app._is_closing and not app._batch:
             app.plotter_ref.render()
 
 
 def apply_auto_contrast(app) -> None:
+    cancel_pending_gamma(app)
     rgb = app.original_colors.astype(np.float32) / 255.0
 
     p_low, p_high = 2, 98
@@ -387,15 +406,15 @@ def apply_auto_contrast(app) -> None:
     app.enhanced_colors = (stretched * 255).astype(np.uint8)
 
     current = app.colors.copy()
-    mask = np.all(current == app.original_colors, axis=1)
+    mask = rgb_rows_equal(current, app.original_colors)
     current[mask] = app.enhanced_colors[mask]
 
     app.cloud["RGB"] = current
     update_annotation_visibility(app)
 
-    if app.repair_mode and hasattr(app, "cloud_ref"):
+    if app.repair_mode and app.cloud_ref is not None:
         app.cloud_ref["RGB"] = app.original_colors.astype(np.uint8)
-        if not getattr(app, "_is_closing", False) and not getattr(app, "_batch", False):
+        if not app._is_closing and not app._batch:
             app.plotter_ref.render()
 
     if "gamma" in app.ribbon_sliders:
@@ -454,10 +473,10 @@ def on_alpha_change(app, val) -> None:
 
 
 def update_annotation_visibility(app) -> None:
-    if getattr(app, "_is_closing", False):
+    if app._is_closing:
         return
 
-    if not hasattr(app, "cloud") or app.cloud is None:
+    if app.cloud is None:
         return
 
     base = getattr(app, "enhanced_colors", None)
@@ -469,14 +488,14 @@ def update_annotation_visibility(app) -> None:
 
     if not getattr(app, "annotations_visible", True):
         app.cloud["RGB"] = display.astype(np.uint8)
-        if not getattr(app, "_is_closing", False) and not getattr(app, "_batch", False):
+        if not app._is_closing and not app._batch:
             app.plotter.render()
         return
 
-    edited_mask = np.any(app.colors != app.original_colors, axis=1)
+    edited_mask = ~rgb_rows_equal(app.colors, app.original_colors)
     if not np.any(edited_mask):
         app.cloud["RGB"] = display.astype(np.uint8)
-        if not getattr(app, "_is_closing", False) and not getattr(app, "_batch", False):
+        if not app._is_closing and not app._batch:
             app.plotter.render()
         return
 
@@ -492,7 +511,7 @@ def update_annotation_visibility(app) -> None:
         display[edited_mask] = out
 
     app.cloud["RGB"] = display.astype(np.uint8)
-    if not getattr(app, "_is_closing", False) and not getattr(app, "_batch", False):
+    if not app._is_closing and not app._batch:
         app.plotter.render()
 
 
@@ -509,7 +528,10 @@ def toggle_repair_mode(app, on: bool) -> None:
     app.repair_mode = bool(on)
     pending_split = bool(app.act_repair.isChecked() or app.act_clone.isChecked())
     want_split = bool(app.repair_mode or app.clone_mode or pending_split)
-    app.plotter_ref.setVisible(want_split)
+    if want_split:
+        app._ensure_ref_plotter()
+    if app.plotter_ref is not None:
+        app.plotter_ref.setVisible(want_split)
     app.vline.setVisible(want_split)
 
     if app.repair_mode and not app.act_annotation_mode.isChecked():
@@ -525,10 +547,7 @@ def toggle_repair_mode(app, on: bool) -> None:
     elif not app.clone_mode:
         app.act_eraser.setChecked(False)
 
-    if hasattr(app, "left_title"):
-        app.left_title.setVisible(want_split)
-
-    if app.repair_mode and hasattr(app, "cloud_ref"):
+    if app.repair_mode and app.cloud_ref is not None:
         app.cloud_ref["RGB"] = app.original_colors.astype(np.uint8)
 
     if want_split:
@@ -538,8 +557,6 @@ def toggle_repair_mode(app, on: bool) -> None:
 
     if was_split != want_split:
         QtCore.QTimer.singleShot(0, app._finalize_layout)
-    else:
-        QtCore.QTimer.singleShot(0, app._position_overlays)
     update_annotation_visibility(app)
 
 
@@ -558,18 +575,17 @@ def toggle_clone_mode(app, on: bool) -> None:
     want_split = bool(app.repair_mode or app.clone_mode or pending_split)
 
     if app.clone_mode:
+        # Build the ref view first: the setChecked calls below reach update_cursor.
+        app._ensure_ref_plotter()
         app.act_annotation_mode.setChecked(True)
         app.act_toggle_annotations.setChecked(True)
 
         app.plotter_ref.setVisible(True)
         app.vline.setVisible(True)
-        if hasattr(app, "left_title"):
-            app.left_title.setVisible(True)
     elif not want_split:
-        app.plotter_ref.setVisible(False)
+        if app.plotter_ref is not None:
+            app.plotter_ref.setVisible(False)
         app.vline.setVisible(False)
-        if hasattr(app, "left_title"):
-            app.left_title.setVisible(False)
 
         app.current_color = app._last_paint_color.copy()
 
@@ -580,8 +596,6 @@ def toggle_clone_mode(app, on: bool) -> None:
 
     if was_split != want_split:
         QtCore.QTimer.singleShot(0, app._finalize_layout)
-    else:
-        QtCore.QTimer.singleShot(0, app._position_overlays)
     update_cursor(app)
 
 
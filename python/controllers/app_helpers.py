@@ -6,14 +6,14 @@ import platform
 from PyQt5 import QtCore, QtWidgets
 
 from configs.constants import VERSION_NUMBER
-from services.storage import log_gui, save_state
+from services.storage import flush_state, log_gui, save_state
 
 
 def release_view_combo_focus(app) -> None:
     """Drop combo focus so the blue highlight doesn't linger."""
     def _focus():
         try:
-            if hasattr(app, "plotter"):
+            if app.plotter is not None:
                 app.plotter.interactor.setFocus()
             else:
                 app.setFocus()
@@ -59,7 +59,7 @@ def clone_source(app):
 
 
 def is_split_mode(app) -> bool:
-    return bool(app.repair_mode or app.clone_mode) and hasattr(app, "plotter_ref") and app.plotter_ref.isVisible()
+    return bool(app.repair_mode or app.clone_mode) and app.plotter_ref is not None and app.plotter_ref.isVisible()
 
 
 def shared_cam_active(app) -> bool:
@@ -86,7 +86,7 @@ def _get_opengl_info(app) -> tuple[str, str]:
     vendor = ""
     renderer = ""
     try:
-        if hasattr(app, "plotter"):
+        if app.plotter is not None:
             try:
                 app.plotter.render()
             except Exception:
@@ -187,13 +187,13 @@ def set_points_render_mode(app, on: bool) -> None:
         f"points_as_spheres={bool(on)} source=ui"
     )
 
-    if not getattr(app, "_is_closing", False) and not getattr(app, "_batch", False):
+    if not app._is_closing and not app._batch:
         try:
             app.plotter.render()
         except Exception:
             pass
         try:
-            if hasattr(app, "plotter_ref") and app.plotter_ref.isVisible():
+            if app.plotter_ref is not None and app.plotter_ref.isVisible():
                 app.plotter_ref.render()
         except Exception:
             pass
@@ -256,7 +256,7 @@ def close_event(app, e) -> None:
     except Exception:
         pass
 
-    for view in [getattr(app, "plotter_ref", None), getattr(app, "plotter", None)]:
+    for view in [app.plotter_ref, app.plotter]:
         try:
             if view is not None:
                 view.close()
@@ -281,6 +281,7 @@ def close_event(app, e) -> None:
             "index": int(app.index),
             "nav_dock_width": int(app.nav_dock.width()),
         })
+        flush_state()
     except Exception:
         pass
 
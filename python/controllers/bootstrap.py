@@ -2,13 +2,15 @@ from __future__ import annotations
 
 from pathlib import Path
 
+import numpy as np
 from PyQt5 import QtCore, QtWidgets
 from PyQt5.QtGui import QKeySequence
 from PyQt5.QtWidgets import QShortcut
 
-from configs.constants import NAV_DOCK_WIDTH, NAV_NAME_MAX, NAV_THUMB_SIZE, NAV_FAST_THRESHOLD, NAV_FAST_ICON_BATCH
+from configs.constants import MSAA_SAMPLES, NAV_DOCK_WIDTH, NAV_NAME_MAX, NAV_THUMB_SIZE, NAV_FAST_THRESHOLD
 from services.storage import load_state, log_gui, save_state
 from controllers import app_helpers
+from controllers.io import orig_dir_matches, reset_file_flags
 from services.thumbnail import ThumbnailService
 
 
@@ -45,7 +47,7 @@ def init_state(app) -> None:
     app.NAV_THUMB_SIZE = NAV_THUMB_SIZE
     app.NAV_NAME_MAX = NAV_NAME_MAX
     app.NAV_FAST_THRESHOLD = NAV_FAST_THRESHOLD
-    app.NAV_FAST_ICON_BATCH = NAV_FAST_ICON_BATCH
+    app.msaa_samples = MSAA_SAMPLES   # 0 turns AA off on slow GL paths
     app.brush_size = 8
     app.initial_loop_timer = 1.0
     app.point_size = 6
@@ -57,14 +59,19 @@ def init_state(app) -> None:
     app.ann_dir, app.orig_dir = None, None
     app.annotations_visible = True
     app._session_edited = None
+    app._loaded_key = None
+    app._annotated_pair_cache = {}
     app.annotation_alpha = 1.0
     app.repair_mode = False
     app.clone_mode = False
     app._is_closing = False
+    app.plotter = app.plotter_ref = None
+    app.cloud = app.cloud_ref = None
 
     app._shared_camera = None
     app._cam_observer_id = None
     app._cam_syncing = False
+    app._cam_dirty = True
 
     app._batch = False
     app._cam_pause = False
@@ -73,6 +80,12 @@ def init_state(app) -> None:
     app._need_split_fit = False
 
     app._fit_pad = 1.08
+    app._fit_hysteresis_px = 2
+    app._fit_resize_only = False
+    app._last_fit_size = None
+    app._bounds_cache = {}
+    app._mat4_buf = np.empty(16, dtype=float)
+    app._unproj_cache = None
 
     app.current_view = 0
 
@@ -81,9 +94,7 @@ def init_state(app) -> None:
 
     app.loop_delay_sec = float(app.initial_loop_timer)
 
-    app._visited = set()
-    app._annotated = set()
-    app._dirty = set()
+    reset_file_flags(app)
 
     app._fit_delay_ms = 33
 
@@ -104,8 +115,9 @@ def init_state(app) -> None:
     app._nav_last_width = NAV_DOCK_WIDTH
     app._nav_was_visible = True
     app._nav_fast_mode = False
-    app._nav_fast_icon_timer = None
-    app._nav_fast_icon_idx = 0
+    app._nav_flags_shown = np.zeros(0, dtype=np.uint8)
+    app._nav_idx_width = 4
+    app._nav_dirty_idx = set()
 
 
 def init_timers(app) -> None:
@@ -113,8 +125,22 @@ def init_timers(app) -> None:
     app._fit_timer.setSingleShot(True)
     app._fit_timer.timeout.connect(app._fit_to_canvas)
 
+    app._ui_refresh_timer = QtCore.QTimer(app)
+    app._ui_refresh_timer.setSingleShot(True)
+    app._ui_refresh_timer.timeout.connect(app._refresh_ui)
+
     app.thumbs = ThumbnailService(app, NAV_THUMB_SIZE)
 
+    app._render_pending = []
+    app._render_delay_ms = 8
+    app._render_timer = QtCore.QTimer(app)
+    app._render_timer.setSingleShot(True)
+    app._render_timer.timeout.connect(app._flush_render)
+
+    app._nav_flush_timer = QtCore.QTimer(app)
+    app._nav_flush_timer.setSingleShot(True)
+    app._nav_flush_timer.timeout.connect(app._flush_nav)
+
     app._stroke_render_timer = QtCore.QTimer(app)
     app._stroke_render_timer.setSingleShot(True)
     app._stroke_render_timer.timeout.connect(app._render_views_once)
@@ -229,9 +255,6 @@ def init_interaction(app) -> None:
     app.plotter.interactor.setMouseTracking(True)
     app.plotter.interactor.installEventFilter(app)
 
-    app.plotter_ref.interactor.setMouseTracking(True)
-    app.plotter_ref.interactor.installEventFilter(app)
-
 
 def restore_state(app) -> None:
     try:
@@ -255,8 +278,9 @@ def restore_state(app) -> None:
             app.files = app._get_sorted_files()
             if app.files and (app.index < 0 or app.index >= len(app.files)):
                 app.index = 0
+            reset_file_flags(app)
             if app.orig_dir is not None:
-                has_full_match = all((app.orig_dir / p.name).exists() for p in app.files)
+                has_full_match = orig_dir_matches(app.orig_dir, app.files)
                 if not has_full_match:
                     log_gui(f"restore_state: orig_dir cleared (mismatch) orig_dir={app.orig_dir}")
                     app.orig_dir = None
@@ -5,7 +5,7 @@ from PyQt5 import QtCore, QtWidgets
 
 
 def event_filter(app, obj, event):
-    if getattr(app, "_is_closing", False):
+    if app._is_closing:
         return False
 
     is_text_input = isinstance(obj, QtWidgets.QLineEdit)
@@ -88,7 +88,7 @@ def event_filter(app, obj, event):
                 app.on_page(+10)
                 return True
 
-    if obj is getattr(app, "plotter", None) or obj is getattr(app, "plotter_ref", None):
+    if obj is app.plotter or obj is app.plotter_ref:
         if event.type() == QtCore.QEvent.Wheel:
             delta_y = event.angleDelta().y()
             # Right pane wheel
@@ -105,7 +105,7 @@ def event_filter(app, obj, event):
                     app._zoom_at_cursor_for(app.plotter_ref, event.x(), event.y(), delta_y)
                 return True
 
-    if obj is getattr(app, "plotter", None) or obj is getattr(app, "plotter_ref", None):
+    if obj is app.plotter or obj is app.plotter_ref:
         if event.type() == QtCore.QEvent.MouseButtonPress and event.button() == QtCore.Qt.LeftButton:
             if not hasattr(app, "colors"):
                 return False
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 from pathlib import Path
 import shutil
 
@@ -7,10 +8,12 @@ import numpy as np
 import pyvista as pv
 from PyQt5 import QtCore, QtWidgets
 from scipy.spatial import cKDTree
-from vtkmodules.vtkIOPLY import vtkPLYWriter
+from vtkmodules.vtkIOPLY import vtkPLYReader, vtkPLYWriter
 
 from services.storage import load_state, log_gui, save_state
 from controllers import app_helpers
+from controllers.annotation import cancel_pending_gamma, rgb_rows_equal
+from ui.overlays import VIEW_TITLE_ANNOTATED, VIEW_TITLE_ORIGINAL, add_view_title
 
 
 def natural_key(path):
@@ -25,6 +28,39 @@ def get_sorted_files(app):
     return sorted(all_files, key=natural_key)
 
 
+def orig_dir_matches(orig_dir: Path, files) -> bool:
+    """True if every file name in ``files`` also exists in ``orig_dir`` (one listdir)."""
+    try:
+        orig_names = set(os.listdir(orig_dir))
+    except OSError:
+        orig_names = set()
+    return all(p.name in orig_names for p in files)
+
+
+def reset_file_flags(app) -> None:
+    """Allocate per-file visited/annotated/dirty/bad bitmaps for app.files."""
+    n = len(app.files)
+    app._visited = np.zeros(n, dtype=bool)
+    app._annotated = np.zeros(n, dtype=bool)
+    app._dirty = np.zeros(n, dtype=bool)
+    app._bad_files = np.zeros(n, dtype=bool)
+
+
+def remap_file_flags(app, old_files) -> None:
+    """Carry per-file bitmaps over to a re-listed app.files, matching by name."""
+    name_to_old = {p.name: i for i, p in enumerate(old_files)}
+    src = np.fromiter(
+        (name_to_old.get(p.name, -1) for p in app.files), dtype=np.intp, count=len(app.files)
+    )
+    keep = src >= 0
+    for attr in ("_visited", "_annotated", "_dirty", "_bad_files"):
+        old = getattr(app, attr)
+        new = np.zeros(len(app.files), dtype=bool)
+        if len(old) == len(old_files):
+            new[keep] = old[src[keep]]
+        setattr(app, attr, new)
+
+
 def _project_pairs_for(app) -> dict:
     try:
         st = load_state()
@@ -56,6 +92,13 @@ def open_ann_folder(app) -> None:
     app.files = app._get_sorted_files()
 
     if not app.files:
+        app.index = 0
+        app.history.clear()
+        app.redo_stack.clear()
+        reset_file_flags(app)
+        app.thumbs.new_generation()
+        app._populate_nav_list()
+        app._update_status_bar()
         QtWidgets.QMessageBox.critical(
             app, "Error", "No PLY/PCD in Annotation folder"
         )
@@ -64,13 +107,11 @@ def open_ann_folder(app) -> None:
     app.index = 0
     app.history.clear()
     app.redo_stack.clear()
-    app._visited.clear()
-    app._annotated.clear()
-    app._dirty.clear()
+    reset_file_flags(app)
 
     if app._pending_orig_dir is not None:
         cand = app._pending_orig_dir
-        has_full_match = all((cand / p.name).exists() for p in app.files)
+        has_full_match = orig_dir_matches(cand, app.files)
         app.orig_dir = cand if has_full_match else None
         app._pending_orig_dir = None
     else:
@@ -84,7 +125,7 @@ def open_ann_folder(app) -> None:
         cand = pairs.get(str(app.ann_dir), "")
         app.orig_dir = Path(cand) if cand else None
         if app.orig_dir is not None:
-            has_full_match = all((app.orig_dir / p.name).exists() for p in app.files)
+            has_full_match = orig_dir_matches(app.orig_dir, app.files)
             if not has_full_match:
                 log_gui(f"open_ann_folder: orig_dir cleared (mismatch) orig_dir={app.orig_dir}")
                 app.orig_dir = None
@@ -132,9 +173,7 @@ def open_orig_folder(app) -> None:
     app.index = 0
     app.history.clear()
     app.redo_stack.clear()
-    app._visited.clear()
-    app._annotated.clear()
-    app._dirty.clear()
+    reset_file_flags(app)
 
     app.orig_dir = cand
     app._pending_orig_dir = cand
@@ -171,20 +210,20 @@ def refresh_folders(app, *, reload: bool = True, show_message: bool = True) -> b
             )
         return False
 
+    old_files = list(app.files)
     if app.ann_dir:
         app.directory = app.ann_dir
         app.files = app._get_sorted_files()
     else:
         app.directory = None
         app.files = []
+    remap_file_flags(app, old_files)
 
     if not app.files:
         app.index = 0
         app.history.clear()
         app.redo_stack.clear()
-        app._visited.clear()
-        app._annotated.clear()
-        app._dirty.clear()
+        reset_file_flags(app)
         app.thumbs.new_generation()
         app.thumbs.prune_ann_thumbs()
         app._populate_nav_list()
@@ -196,7 +235,7 @@ def refresh_folders(app, *, reload: bool = True, show_message: bool = True) -> b
         return False
 
     if app.orig_dir is not None:
-        has_full_match = all((app.orig_dir / p.name).exists() for p in app.files)
+        has_full_match = orig_dir_matches(app.orig_dir, app.files)
         if not has_full_match:
             log_gui(f"refresh_folders: orig_dir cleared (mismatch) orig_dir={app.orig_dir}")
             app.orig_dir = None
@@ -214,7 +253,6 @@ def refresh_folders(app, *, reload: bool = True, show_message: bool = True) -> b
         app.history.clear()
         app.redo_stack.clear()
         app.load_cloud()
-        app._position_overlays()
 
     save_state({
         "annotation_dir": str(app.ann_dir or ""),
@@ -306,26 +344,11 @@ def move_current_to_folder(app) -> None:
 
     old_files = list(app.files)
     old_index = app.index
+    app._loaded_key = None
 
     app.files = app._get_sorted_files()
 
-    name_to_idx = {p.name: i for i, p in enumerate(app.files)}
-
-    def _remap(indices: set[int]) -> set[int]:
-        out = set()
-        for i in indices:
-            if 0 <= i < len(old_files):
-                name = old_files[i].name
-                new_i = name_to_idx.get(name)
-                if new_i is not None:
-                    out.add(new_i)
-        return out
-
-    app._visited = _remap(app._visited)
-    app._annotated = _remap(app._annotated)
-    app._dirty = _remap(app._dirty)
-    if getattr(app, "_bad_files", None) is not None:
-        app._bad_files = _remap(app._bad_files)
+    remap_file_flags(app, old_files)
 
     if app.files:
         app.index = min(old_index, len(app.files) - 1)
@@ -343,7 +366,6 @@ def move_current_to_folder(app) -> None:
 
     if app.files:
         app.load_cloud()
-        app._position_overlays()
 
     save_state({
         "annotation_dir": str(app.ann_dir or ""),
@@ -357,6 +379,47 @@ def move_current_to_folder(app) -> None:
     log_gui(f"move_current_to_folder: moved={src} dest={dest} files={len(app.files)}")
 
 
+def read_cloud(app, path: Path) -> pv.PolyData:
+    """Read a point cloud, reusing one vtkPLYReader for PLY files."""
+    if path.suffix.lower() != ".ply":
+        return pv.read(str(path))
+    reader = getattr(app, "_ply_reader", None)
+    if reader is None:
+        reader = vtkPLYReader()
+        app._ply_reader = reader
+    reader.SetFileName(str(path))
+    reader.Update()
+    if reader.GetErrorCode():
+        raise IOError(f"Failed to read PLY file: {path}")
+    pc = pv.PolyData()
+    pc.ShallowCopy(reader.GetOutput())
+    return pc
+
+
+def _loaded_key(app, path: Path):
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return (str(path), st.st_mtime_ns, st.st_size, str(app.orig_dir or ""))
+
+
+def add_ref_actor(app, render_points_as_spheres: bool) -> None:
+    """(Re)draw cloud_ref in the Original view, if that view has been built."""
+    if app.plotter_ref is None or app.cloud_ref is None:
+        return
+    app.plotter_ref.clear()
+    add_view_title(app.plotter_ref, VIEW_TITLE_ORIGINAL)
+    app.actor_ref = app.plotter_ref.add_points(
+        app.cloud_ref,
+        scalars="RGB",
+        rgb=True,
+        point_size=app.point_size,
+        reset_camera=False,
+        render_points_as_spheres=render_points_as_spheres,
+    )
+
+
 def load_cloud(app) -> None:
     if not app.files or app.index < 0 or app.index >= len(app.files):
         ready = refresh_folders(app, reload=False, show_message=False)
@@ -365,8 +428,18 @@ def load_cloud(app) -> None:
         if app.index < 0 or app.index >= len(app.files):
             return
 
+    # Same file, unchanged on disk, no unsaved edits: nothing to reload.
+    key = _loaded_key(app, Path(app.files[app.index]))
+    edited = app._session_edited is not None and np.any(app._session_edited)
+    if key is not None and key == app._loaded_key and not edited:
+        # Flag arrays may have been reset (folder reopen/refresh) since the load.
+        app._visited[app.index] = True
+        app._decorate_nav_item(app.index)
+        return
+    app._loaded_key = None
+
     def _read_cloud(path: Path) -> pv.PolyData:
-        pc_local = pv.read(str(path))
+        pc_local = read_cloud(app, path)
         if getattr(pc_local, "n_points", 0) <= 0:
             raise ValueError("Point cloud contains no points.")
         return pc_local
@@ -389,9 +462,7 @@ def load_cloud(app) -> None:
                 "Load Error",
                 f"Failed to load point cloud:\n{path}\n\n{exc}",
             )
-            if getattr(app, "_bad_files", None) is None:
-                app._bad_files = set()
-            app._bad_files.add(app.index)
+            app._bad_files[app.index] = True
             app.index = (app.index + 1) % len(app.files)
             if app.index == start_index:
                 break
@@ -406,90 +477,85 @@ def load_cloud(app) -> None:
     if app.index != start_index:
         app._sync_nav_selection()
 
-    app._visited.add(app.index)
+    app._visited[app.index] = True
     app._decorate_nav_item(app.index)
 
-    app._begin_batch()
-
-    app.cloud = pc
-
-    app.colors = pc["RGB"].copy()
-
-    app.original_colors = app.colors.copy()
-    if app.orig_dir:
-        cand = app.orig_dir / Path(app.files[app.index]).name
-        if cand.exists():
-            try:
-                pc0 = pv.read(str(cand))
-                if "RGB" in pc0.array_names and pc0.n_points == pc.n_points:
-                    app.original_colors = pc0["RGB"].copy()
-            except Exception as exc:
-                log_gui(f"load_cloud: failed orig read path={cand} err={exc}")
-
-    app.kdtree = cKDTree(pc.points)
-
-    app.enhanced_colors = app.original_colors.copy()
-
-    app.cloud["RGB"] = app.enhanced_colors.astype(np.uint8)
-
-    app._pre_fit_camera(app.cloud, app.plotter)
-    app.plotter.clear()
-    render_points_as_spheres = (
-        app.act_points_spheres.isChecked()
-        if hasattr(app, "act_points_spheres")
-        else app_helpers.render_points_as_spheres(app)
-    )
-    app_helpers._log_gl_info_once(app, render_points_as_spheres)
-
-    app.actor = app.plotter.add_points(
-        app.cloud,
-        scalars="RGB",
-        rgb=True,
-        point_size=app.point_size,
-        reset_camera=False,
-        render_points_as_spheres=render_points_as_spheres,
-    )
-
-    app.plotter_ref.clear()
+    with app._batched():
+        app.cloud = pc
+        app._bounds_cache.clear()
+
+        app.colors = pc["RGB"].copy()
+
+        app.original_colors = app.colors.copy()
+        if app.orig_dir:
+            cand = app.orig_dir / Path(app.files[app.index]).name
+            if cand.exists():
+                try:
+                    pc0 = read_cloud(app, cand)
+                    if "RGB" in pc0.array_names and pc0.n_points == pc.n_points:
+                        app.original_colors = pc0["RGB"].copy()
+                except Exception as exc:
+                    log_gui(f"load_cloud: failed orig read path={cand} err={exc}")
+
+        app.kdtree = cKDTree(pc.points)
+
+        app.enhanced_colors = app.original_colors.copy()
+
+        app.cloud["RGB"] = app.enhanced_colors.astype(np.uint8)
+
+        # Points are shared with cloud_ref, so one bounds pass serves every pre-fit.
+        bounds = app.cloud.bounds
+        app._pre_fit_camera_from_bounds(bounds, app.plotter)
+        app.plotter.clear()
+        add_view_title(app.plotter, VIEW_TITLE_ANNOTATED)
+        render_points_as_spheres = (
+            app.act_points_spheres.isChecked()
+            if hasattr(app, "act_points_spheres")
+            else app_helpers.render_points_as_spheres(app)
+        )
+        app_helpers._log_gl_info_once(app, render_points_as_spheres)
+
+        app.actor = app.plotter.add_points(
+            app.cloud,
+            scalars="RGB",
+            rgb=True,
+            point_size=app.point_size,
+            reset_camera=False,
+            render_points_as_spheres=render_points_as_spheres,
+        )
 
-    ref_colors = app.original_colors.astype(np.uint8)
-    app.cloud_ref = pv.PolyData(app.cloud.points.copy())
-    app.cloud_ref["RGB"] = ref_colors
+        ref_colors = app.original_colors.astype(np.uint8)
+        # Shallow copy shares the points/cells with app.cloud; only RGB is its own.
+        app.cloud_ref = app.cloud.copy(deep=False)
+        app.cloud_ref["RGB"] = ref_colors
 
-    app.actor_ref = app.plotter_ref.add_points(
-        app.cloud_ref,
-        scalars="RGB",
-        rgb=True,
-        point_size=app.point_size,
-        reset_camera=False,
-        render_points_as_spheres=render_points_as_spheres,
-    )
+        add_ref_actor(app, render_points_as_spheres)
 
-    app._pre_fit_camera(app.cloud, app.plotter)
+        app._pre_fit_camera_from_bounds(bounds, app.plotter)
 
-    if app._shared_cam_active():
-        app.plotter_ref.renderer.SetActiveCamera(app.plotter.renderer.GetActiveCamera())
-        app._shared_camera = app.plotter.renderer.GetActiveCamera()
-        app._need_split_fit = True
-    else:
-        app._pre_fit_camera(app.cloud_ref, app.plotter_ref)
+        if app._shared_cam_active():
+            app.plotter_ref.renderer.SetActiveCamera(app.plotter.renderer.GetActiveCamera())
+            app._shared_camera = app.plotter.renderer.GetActiveCamera()
+            app._need_split_fit = True
+        elif app.plotter_ref is not None:
+            app._pre_fit_camera_from_bounds(bounds, app.plotter_ref)
 
-    app.plotter.track_click_position(lambda pos: app.on_click(pos[0], pos[1]))
+        app.plotter.track_click_position(lambda pos: app.on_click(pos[0], pos[1]))
 
-    app._position_overlays()
+        app._last_gamma_value = 100
+        cancel_pending_gamma(app)
+        app.on_gamma_change(100)
+        app.enhanced_colors = app.original_colors.copy()
 
-    app._last_gamma_value = 100
-    app.on_gamma_change(100)
-    app.enhanced_colors = app.original_colors.copy()
+        app._session_edited = np.zeros(app.cloud.n_points, dtype=bool)
+        has_any_edit_now = not rgb_rows_equal(app.colors, app.original_colors).all()
+        app.act_toggle_annotations.setEnabled(True)
 
-    app._session_edited = np.zeros(app.cloud.n_points, dtype=bool)
-    has_any_edit_now = np.any(app.colors != app.original_colors)
-    app.act_toggle_annotations.setEnabled(True)
+        app.annotations_visible = getattr(app, "act_toggle_annotations", None) is None or app.act_toggle_annotations.isChecked()
+        app.update_annotation_visibility()
 
-    app.annotations_visible = getattr(app, "act_toggle_annotations", None) is None or app.act_toggle_annotations.isChecked()
-    app.update_annotation_visibility()
-    app._end_batch()
     app._update_status_bar()
+    app._loaded_key = _loaded_key(app, Path(app.files[app.index]))
 
 
 def on_save(app, _autosave: bool = False) -> None:
@@ -508,8 +574,8 @@ def on_save(app, _autosave: bool = False) -> None:
     save_colors = app.colors.copy()
 
     if choice == QtWidgets.QMessageBox.Yes:
-        untouched_mask = ~np.any(save_colors != app.original_colors, axis=1)
-        save_colors[untouched_mask] = app.enhanced_colors[untouched_mask]
+        untouched_mask = rgb_rows_equal(save_colors, app.original_colors)
+        np.copyto(save_colors, app.enhanced_colors, where=untouched_mask[:, None])
 
     app.cloud["RGB"] = save_colors
 
@@ -538,7 +604,8 @@ def on_save(app, _autosave: bool = False) -> None:
             f"Successfully saved {ext[1:]} file with colors to and reloaded:\n{out}",
         )
 
-    app._dirty.discard(app.index)
-    app._annotated.add(app.index)
+    app._loaded_key = None
+    app._dirty[app.index] = False
+    app._annotated[app.index] = True
     app._decorate_nav_item(app.index)
     app._update_status_bar()
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
+import numpy as np
 from PyQt5 import QtCore, QtWidgets
 from joblib import Parallel, delayed
 
-from services.annotation_state import is_annotated_pair
+from services.annotation_state import annotated_pair_key, is_annotated_pair
 from services.storage import load_nav_dock_width
 
 
@@ -32,9 +33,7 @@ def on_nav_search_entered(app) -> None:
             app.history.clear()
             app.redo_stack.clear()
             app.load_cloud()
-            app._position_overlays()
-            app._sync_nav_selection()
-            app._update_status_bar()
+            app._schedule_ui_refresh()
             app._nav_release_pending = True
             QtCore.QTimer.singleShot(0, app._reset_nav_search)
             return
@@ -58,9 +57,7 @@ def on_nav_search_entered(app) -> None:
     app.history.clear()
     app.redo_stack.clear()
     app.load_cloud()
-    app._position_overlays()
-    app._sync_nav_selection()
-    app._update_status_bar()
+    app._schedule_ui_refresh()
 
     app._nav_release_pending = True
     QtCore.QTimer.singleShot(0, app._reset_nav_search)
@@ -85,113 +82,40 @@ def nav_row_text(app, i: int) -> str:
     """Row label: '0001 | filename.ply' (1-based index)."""
     if not app.files:
         return ""
-    idx_w = max(4, len(str(len(app.files))))
-    return f"{i+1:0{idx_w}d} | {app.files[i].name}"
+    return f"{i+1:0{app._nav_idx_width}d} | {app.files[i].name}"
 
 
 def populate_nav_list(app) -> None:
     if not hasattr(app, "nav_list"):
         return
 
-    app._nav_item_widgets = {}
+    n = len(app.files)
+    # Per-row flag bits currently shown (see decorate_nav_item).
+    app._nav_flags_shown = (
+        app._visited.astype(np.uint8)
+        | app._dirty.astype(np.uint8) << 1
+        | app._annotated.astype(np.uint8) << 2
+    ) if len(app._visited) == n else np.zeros(n, dtype=np.uint8)
+    app._nav_idx_width = max(4, len(str(n)))
     app.thumbs.reset_queue()
-    app._nav_fast_mode = len(app.files) >= getattr(app, "NAV_FAST_THRESHOLD", 50000)
-
-    if app._nav_fast_icon_timer is not None:
-        try:
-            app._nav_fast_icon_timer.stop()
-        except Exception:
-            pass
-
-    app.nav_list.blockSignals(True)
-    app.nav_list.clear()
-
-    if not app.files:
-        app.nav_list.blockSignals(False)
-        return
+    app._nav_fast_mode = n >= getattr(app, "NAV_FAST_THRESHOLD", 50000)
 
+    app.nav_list.setItemDelegate(
+        app._nav_default_delegate if app._nav_fast_mode else app._nav_delegate
+    )
     if app._nav_fast_mode:
         app.nav_list.setIconSize(QtCore.QSize(app.NAV_THUMB_SIZE, app.NAV_THUMB_SIZE))
-        for i in range(len(app.files)):
-            item = QtWidgets.QListWidgetItem()
-            item.setText(app._nav_row_text(i))
-            item.setToolTip(app.files[i].name)
-            item.setData(QtCore.Qt.UserRole, i)
-            item.setSizeHint(QtCore.QSize(app.NAV_THUMB_SIZE + 16, app.NAV_THUMB_SIZE + 24))
-            app.nav_list.addItem(item)
-            app.thumbs.request_thumbnail(i)
-    else:
-        for i in range(len(app.files)):
-            item = QtWidgets.QListWidgetItem()
-            item.setSizeHint(QtCore.QSize(app.NAV_THUMB_SIZE + 16, app.NAV_THUMB_SIZE + 48))
-            item.setData(QtCore.Qt.UserRole, i)
-
-            w = app._make_nav_item_widget(i)
-
-            app.nav_list.addItem(item)
-            app.nav_list.setItemWidget(item, w)
-
-            app.thumbs.request_thumbnail(i)
-
-    app.nav_list.blockSignals(False)
-
-    app._sync_nav_selection()
-
-    max_idx = len(app.files)
-    for idx in (app._dirty | app._annotated | app._visited):
-        if 0 <= idx < max_idx:
-            app._decorate_nav_item(idx)
-
-    if app._nav_fast_mode:
-        _schedule_fast_icon_load(app)
-    app._update_status_bar()
-
-
-def _schedule_fast_icon_load(app) -> None:
-    if not hasattr(app, "nav_list"):
-        return
-    if not app._nav_fast_mode:
-        return
-
-    if app._nav_fast_icon_timer is None:
-        app._nav_fast_icon_timer = QtCore.QTimer(app)
-        app._nav_fast_icon_timer.setInterval(10)
-        app._nav_fast_icon_timer.timeout.connect(lambda: _fast_icon_load_step(app))
-
-    app._nav_fast_icon_idx = 0
-    app._nav_fast_icon_timer.start()
-
-
-def _fast_icon_load_step(app) -> None:
-    if not app._nav_fast_mode:
-        if app._nav_fast_icon_timer is not None:
-            app._nav_fast_icon_timer.stop()
-        return
+    # Rows are views onto app.files; thumbnails load as rows are painted.
+    app.nav_model.reset(app._nav_fast_mode)
 
     if not app.files:
-        if app._nav_fast_icon_timer is not None:
-            app._nav_fast_icon_timer.stop()
-        return
-
-    start = int(getattr(app, "_nav_fast_icon_idx", 0))
-    n = len(app.files)
-    if start >= n:
-        app._nav_fast_icon_timer.stop()
         return
 
-    batch = int(getattr(app, "NAV_FAST_ICON_BATCH", 300))
-    end = min(n, start + max(1, batch))
+    for i in range(n):
+        app.thumbs.request_thumbnail(i)
 
-    for i in range(start, end):
-        icon = app.thumbs.thumb_icon_for_index(i)
-        if icon is not None:
-            item = app.nav_list.item(i)
-            if item is not None:
-                item.setIcon(icon)
-
-    app._nav_fast_icon_idx = end
-    if end >= n:
-        app._nav_fast_icon_timer.stop()
+    app._sync_nav_selection()
+    app._update_status_bar()
 
 
 def sync_nav_selection(app) -> None:
@@ -199,13 +123,13 @@ def sync_nav_selection(app) -> None:
     if not hasattr(app, "nav_list") or not app.files:
         return
     i = int(getattr(app, "index", 0))
-    if i < 0 or i >= app.nav_list.count():
+    if i < 0 or i >= app.nav_model.rowCount():
         return
 
-    app.nav_list.blockSignals(True)
-    app.nav_list.setCurrentRow(i)
-    app.nav_list.scrollToItem(app.nav_list.currentItem(), QtWidgets.QAbstractItemView.PositionAtCenter)
-    app.nav_list.blockSignals(False)
+    # on_nav_row_changed ignores the resulting signal: the row is app.index.
+    index = app.nav_model.index(i)
+    app.nav_list.setCurrentIndex(index)
+    app.nav_list.scrollTo(index, QtWidgets.QAbstractItemView.PositionAtCenter)
 
 
 def on_nav_row_changed(app, row: int) -> None:
@@ -223,8 +147,7 @@ def on_nav_row_changed(app, row: int) -> None:
     app.history.clear()
     app.redo_stack.clear()
     app.load_cloud()
-    app._position_overlays()
-    app._update_status_bar()
+    app._schedule_ui_refresh()
 
 
 def scan_annotated_files(app) -> None:
@@ -232,29 +155,35 @@ def scan_annotated_files(app) -> None:
     if not app.files or not app.orig_dir:
         return
 
-    pairs = []
-    for p in app.files:
+    cache = app._annotated_pair_cache
+    app._annotated = np.zeros(len(app.files), dtype=bool)
+    pending = []
+    for i, p in enumerate(app.files):
         o = app.orig_dir / p.name
-        if o.exists():
-            pairs.append((p, o))
+        key = annotated_pair_key(p, o)
+        if key is None:
+            continue
+        if key in cache:
+            app._annotated[i] = cache[key]
+        else:
+            pending.append((i, p, o, key))
 
     results = Parallel(n_jobs=-1, backend="loky")(
-        delayed(is_annotated_pair)(a, o) for a, o in pairs
+        delayed(is_annotated_pair)(a, o) for _, a, o, _ in pending
     )
 
-    app._annotated.clear()
-    for i, is_ann in enumerate(results):
+    for (i, _, _, key), is_ann in zip(pending, results):
+        cache[key] = bool(is_ann)
         if is_ann:
-            app._annotated.add(i)
+            app._annotated[i] = True
 
-    for idx in app._annotated:
-        app._decorate_nav_item(idx)
+    app._decorate_nav_items(np.flatnonzero(app._annotated))
 
 
 def mark_dirty_once(app) -> None:
     """Mark current cloud dirty once per session."""
-    if app.index not in app._dirty:
-        app._dirty.add(app.index)
+    if not app._dirty[app.index]:
+        app._dirty[app.index] = True
         app._decorate_nav_item(app.index)
 
 
@@ -273,8 +202,9 @@ def update_status_bar(app) -> None:
     else:
         app.sb_index.setText("")
 
-    is_dirty = app.index in getattr(app, "_dirty", set())
-    is_annot = app.index in getattr(app, "_annotated", set())
+    has_flags = 0 <= app.index < len(app._dirty)
+    is_dirty = has_flags and bool(app._dirty[app.index])
+    is_annot = has_flags and bool(app._annotated[app.index])
     if is_dirty:
         app.sb_anno.setText("Modified")
     elif is_annot:
@@ -13,13 +13,23 @@ def maybe_autosave_before_nav(app) -> None:
             app.on_save(_autosave=True)
 
 
+def schedule_ui_refresh(app) -> None:
+    """Coalesce nav-selection/status-bar updates into one deferred call."""
+    app._ui_refresh_timer.start(0)
+
+
+def refresh_ui(app) -> None:
+    if app._is_closing:
+        return
+    app._sync_nav_selection()
+    app._update_status_bar()
+
+
 def _reload_after_nav(app) -> None:
     app.history.clear()
     app.redo_stack.clear()
     app.load_cloud()
-    app._position_overlays()
-    app._sync_nav_selection()
-    app._update_status_bar()
+    schedule_ui_refresh(app)
 
 
 def on_prev(app) -> None:
@@ -1,10 +1,19 @@
 from __future__ import annotations
 
+import math
+from contextlib import contextmanager
+
 import numpy as np
 from PyQt5 import QtCore
+from vtkmodules.vtkCommonMath import vtkMatrix4x4
 from vtkmodules.vtkRenderingCore import vtkCamera
 
 
+def _set_xyz(setter, v) -> None:
+    """Call a VTK 3-component setter without star-unpacking a numpy array."""
+    setter(float(v[0]), float(v[1]), float(v[2]))
+
+
 def snap_camera(app, plotter):
     cam = plotter.camera
     try:
@@ -24,15 +33,16 @@ def restore_camera(app, plotter, snap):
     if not snap:
         return
     cam = plotter.camera
-    cam.SetPosition(*snap["pos"])
-    cam.SetFocalPoint(*snap["fp"])
-    cam.SetViewUp(*snap["vu"])
+    _set_xyz(cam.SetPosition, snap["pos"])
+    _set_xyz(cam.SetFocalPoint, snap["fp"])
+    _set_xyz(cam.SetViewUp, snap["vu"])
     if snap["pp"]:
         cam.ParallelProjectionOn()
         cam.SetParallelScale(snap["ps"])
     else:
         cam.ParallelProjectionOff()
         cam.SetViewAngle(snap["va"])
+    app._cam_dirty = True
 
 
 def set_view(app, idx: int) -> None:
@@ -49,49 +59,95 @@ def set_view(app, idx: int) -> None:
     apply_view(app, idx)
 
 
+def _readonly_unit(v):
+    arr = np.asarray(v, dtype=float)
+    arr = arr / np.linalg.norm(arr)
+    arr.setflags(write=False)
+    return arr
+
+
+# Direction of projection per view index (see the View menu / ribbon combo).
+_VIEW_DIRS = tuple(_readonly_unit(v) for v in (
+    (0.0, 0.0, -1.0),    # 0 Top
+    (0.0, 0.0, 1.0),     # 1 Bottom
+    (0.0, 1.0, 0.0),     # 2 Front
+    (0.0, -1.0, 0.0),    # 3 Back
+    (1.0, 0.0, 0.0),     # 4 Left
+    (-1.0, 0.0, 0.0),    # 5 Right
+    (1.0, 1.0, -1.0),    # 6 SW Isometric
+    (-1.0, 1.0, -1.0),   # 7 SE Isometric
+    (1.0, -1.0, -1.0),   # 8 NW Isometric
+    (-1.0, -1.0, -1.0),  # 9 NE Isometric
+))
+# Top/Bottom are orthographic with +Y up; every other view is perspective, Z up.
+_VIEW_UPS = ((0, 1, 0),) * 2 + ((0, 0, 1),) * 8
+_VIEW_PARALLEL = (True,) * 2 + (False,) * 8
+
+
 def view_direction(app):
-    if app.current_view == 0:
-        return np.array([0.0, 0.0, -1.0])
-    if app.current_view == 1:
-        return np.array([0.0, 0.0, 1.0])
-    if app.current_view == 2:
-        return np.array([0.0, 1.0, 0.0])
-    if app.current_view == 3:
-        return np.array([0.0, -1.0, 0.0])
-    if app.current_view == 4:
-        return np.array([1.0, 0.0, 0.0])
-    if app.current_view == 5:
-        return np.array([-1.0, 0.0, 0.0])
-    if app.current_view == 6:
-        v = np.array([1.0, 1.0, -1.0])
-    elif app.current_view == 7:
-        v = np.array([-1.0, 1.0, -1.0])
-    elif app.current_view == 8:
-        v = np.array([1.0, -1.0, -1.0])
-    else:
-        v = np.array([-1.0, -1.0, -1.0])
-    return v / max(np.linalg.norm(v), 1e-6)
+    """Unit direction of projection for app.current_view (read-only array)."""
+    if 0 <= app.current_view < len(_VIEW_DIRS):
+        return _VIEW_DIRS[app.current_view]
+    return _VIEW_DIRS[-1]
+
+
+_MIN_HALF_FOV_TAN = math.tan(0.5e-3)   # keeps the fit finite for degenerate view angles
+
+
+def _fit_half_tan(cam, aspect: float) -> float:
+    """
+    tan of half the narrower field of view. Since tan(hfov / 2) equals
+    tan(vfov / 2) * aspect, the horizontal FOV never has to be formed.
+    """
+    tvh = math.tan(math.radians(cam.GetViewAngle()) / 2.0)
+    return max(tvh * min(1.0, aspect), _MIN_HALF_FOV_TAN)
+
+
+def mesh_bounds(app, mesh) -> dict:
+    """Bounds-derived values for a mesh, cached until its points change."""
+    pts = mesh.GetPoints()
+    stamp = pts.GetMTime() if pts is not None else 0
+    hit = app._bounds_cache.get(id(mesh))
+    if hit is not None and hit[0] == stamp:
+        return hit[1]
+
+    bounds = tuple(float(v) for v in mesh.bounds)
+    xmin, xmax, ymin, ymax, zmin, zmax = bounds
+    lo = np.array([xmin, ymin, zmin], dtype=float)
+    hi = np.array([xmax, ymax, zmax], dtype=float)
+    extent = hi - lo
+    info = dict(
+        bounds=bounds,
+        center=0.5 * (lo + hi),
+        extent=extent,
+        radius=0.5 * float(np.linalg.norm(extent)),
+    )
+    for arr in (info["center"], extent):
+        arr.setflags(write=False)
+    app._bounds_cache[id(mesh)] = (stamp, info)
+    return info
 
 
 def fit_view(app, plotter):
     """Fit camera of a given plotter to its mesh bounds without changing orientation."""
-    if getattr(app, "_is_closing", False) or getattr(app, "_batch", False):
+    if app._is_closing or app._batch:
         return
     if plotter is None or plotter.renderer is None:
         return
 
     mesh = None
-    if plotter is app.plotter and hasattr(app, "cloud"):
+    if plotter is app.plotter and app.cloud is not None:
         mesh = app.cloud
-    elif plotter is app.plotter_ref and hasattr(app, "cloud_ref"):
+    elif plotter is app.plotter_ref and app.cloud_ref is not None:
         mesh = app.cloud_ref
     if mesh is None or mesh.n_points == 0:
         return
 
-    xmin, xmax, ymin, ymax, zmin, zmax = mesh.bounds
-    cx, cy, cz = (xmin + xmax) / 2, (ymin + ymax) / 2, (zmin + zmax) / 2
-    xr, yr, zr = (xmax - xmin), (ymax - ymin), (zmax - zmin)
-    r = 0.5 * np.linalg.norm([xr, yr, zr])
+    b = mesh_bounds(app, mesh)
+    center = b["center"]
+    cx, cy, cz = center
+    xr, yr, _ = b["extent"]
+    r = b["radius"]
     if r <= 0:
         return
 
@@ -101,9 +157,11 @@ def fit_view(app, plotter):
     aspect = w / float(h)
 
     dirp = np.array(cam.GetDirectionOfProjection(), dtype=float)
-    if not np.isfinite(dirp).all() or np.linalg.norm(dirp) < 1e-6:
+    dn = math.sqrt(float(dirp @ dirp))
+    if not math.isfinite(dn) or dn < 1e-6:
         dirp = view_direction(app)
-    dirp /= np.linalg.norm(dirp)
+    else:
+        dirp /= dn
 
     if cam.GetParallelProjection():
         half_h = 0.5 * yr
@@ -112,49 +170,33 @@ def fit_view(app, plotter):
         cam.SetFocalPoint(cx, cy, cz)
         pos = np.array(cam.GetPosition(), dtype=float)
         if not np.isfinite(pos).all():
-            pos = np.array([cx, cy, cz]) - dirp * (r * 2.0 + 1.0)
-        cam.SetPosition(*pos)
+            pos = center - dirp * (r * 2.0 + 1.0)
+        _set_xyz(cam.SetPosition, pos)
         cam.SetParallelScale(scale_needed * app._fit_pad)
     else:
-        vfov = np.deg2rad(cam.GetViewAngle())
-        hfov = 2 * np.arctan(np.tan(vfov / 2) * aspect)
-        eff = min(vfov, hfov)
-        dist = r / np.tan(eff / 2) * app._fit_pad
-        pos = np.array([cx, cy, cz]) - dirp * dist
+        dist = r / _fit_half_tan(cam, aspect) * app._fit_pad
+        pos = center - dirp * dist
         cam.SetFocalPoint(cx, cy, cz)
-        cam.SetPosition(*pos)
+        _set_xyz(cam.SetPosition, pos)
 
     plotter.reset_camera_clipping_range()
-    if (not getattr(app, "_is_closing", False)
-            and not getattr(app, "_batch", False)
-            and not getattr(app, "_view_change_active", False)):
+    app._cam_dirty = True
+    if not (app._is_closing or app._batch or app._view_change_active):
         plotter.render()
 
 
 def mesh_bounds_in_camera_xy(app, cam, mesh):
     """Return (half_w, half_h) of mesh bounds measured in camera coords (x,y)."""
-    xmin, xmax, ymin, ymax, zmin, zmax = mesh.bounds
-    corners = np.array([
-        [xmin, ymin, zmin, 1.0],
-        [xmin, ymin, zmax, 1.0],
-        [xmin, ymax, zmin, 1.0],
-        [xmin, ymax, zmax, 1.0],
-        [xmax, ymin, zmin, 1.0],
-        [xmax, ymin, zmax, 1.0],
-        [xmax, ymax, zmin, 1.0],
-        [xmax, ymax, zmax, 1.0],
-    ], dtype=float)
-
-    M = cam.GetViewTransformMatrix()
-    mat = np.array([[M.GetElement(r, c) for c in range(4)] for r in range(4)], dtype=float)
-
-    cam_pts = (mat @ corners.T).T
-    x = cam_pts[:, 0]
-    y = cam_pts[:, 1]
-
-    half_w = 0.5 * float(x.max() - x.min())
-    half_h = 0.5 * float(y.max() - y.min())
-    return half_w, half_h
+    extent = mesh_bounds(app, mesh)["extent"]
+
+    buf = app._mat4_buf
+    vtkMatrix4x4.DeepCopy(buf, cam.GetViewTransformMatrix())
+    mat = buf.reshape(4, 4)
+
+    # AABB under an affine map: the projected span along each camera axis is
+    # |R| @ extent, so the eight corners never need to be transformed.
+    half_w, half_h = 0.5 * (np.abs(mat[:2, :3]) @ extent)
+    return float(half_w), float(half_h)
 
 
 def fit_shared_camera_once(app, mesh):
@@ -166,13 +208,13 @@ def fit_shared_camera_once(app, mesh):
 
     cam = app._shared_camera
 
-    xmin, xmax, ymin, ymax, zmin, zmax = mesh.bounds
-    cx, cy, cz = (xmin + xmax) / 2.0, (ymin + ymax) / 2.0, (zmin + zmax) / 2.0
-    center = np.array([cx, cy, cz], dtype=float)
+    b = mesh_bounds(app, mesh)
+    center = b["center"]
+    cx, cy, cz = center
 
     dop = np.array(cam.GetDirectionOfProjection(), dtype=float)
-    n = float(np.linalg.norm(dop))
-    if not np.isfinite(dop).all() or n < 1e-9:
+    n = math.sqrt(float(dop @ dop))
+    if not math.isfinite(n) or n < 1e-9:
         dop = np.array([0.0, 0.0, -1.0], dtype=float)
         n = 1.0
     dop /= n
@@ -181,55 +223,73 @@ def fit_shared_camera_once(app, mesh):
 
     w1 = max(1, int(app.plotter.interactor.width()))
     h1 = max(1, int(app.plotter.interactor.height()))
-    a1 = w1 / float(h1)
-
     w2 = max(1, int(app.plotter_ref.interactor.width()))
     h2 = max(1, int(app.plotter_ref.interactor.height()))
-    a2 = w2 / float(h2)
+    # Both fits are monotone in 1/aspect, so the narrower pane decides for both.
+    a_min = max(min(w1 / float(h1), w2 / float(h2)), 1e-6)
 
-    pad = float(getattr(app, "_fit_pad", 1.10))
+    pad = app._fit_pad
 
     cam.SetFocalPoint(cx, cy, cz)
 
     if cam.GetParallelProjection():
-        s1 = max(half_h, half_w / max(a1, 1e-6))
-        s2 = max(half_h, half_w / max(a2, 1e-6))
-        scale = max(s1, s2) * pad
+        scale = max(half_h, half_w / a_min) * pad
 
         pos = np.array(cam.GetPosition(), dtype=float)
         if not np.isfinite(pos).all():
-            r = float(np.linalg.norm([xmax - xmin, ymax - ymin, zmax - zmin])) or 1.0
+            r = 2.0 * b["radius"] or 1.0
             pos = center - dop * (r * 2.0 + 1.0)
 
-        cam.SetPosition(*pos)
+        _set_xyz(cam.SetPosition, pos)
         cam.SetParallelScale(scale)
 
     else:
-        vfov = np.deg2rad(float(cam.GetViewAngle()))
-        vfov = max(vfov, 1e-3)
-
-        def dist_needed(aspect):
-            hfov = 2.0 * np.arctan(np.tan(vfov / 2.0) * max(aspect, 1e-6))
-            hfov = max(hfov, 1e-3)
-            d_h = half_h / np.tan(vfov / 2.0)
-            d_w = half_w / np.tan(hfov / 2.0)
-            return max(d_h, d_w)
-
-        dist = max(dist_needed(a1), dist_needed(a2)) * pad
-        cam.SetPosition(*(center - dop * dist))
+        # tan(hfov / 2) == tan(vfov / 2) * aspect, so no per-pane trig is needed.
+        tvh = max(math.tan(math.radians(float(cam.GetViewAngle())) / 2.0), _MIN_HALF_FOV_TAN)
+        d_h = half_h / tvh
+        d_w = half_w / max(tvh * a_min, _MIN_HALF_FOV_TAN)
+        dist = max(d_h, d_w) * pad
+        _set_xyz(cam.SetPosition, center - dop * dist)
+    app._cam_dirty = True
+
+
+def _fit_size_key(app, split: bool):
+    """Widget sizes plus everything else a fit depends on, for resize hysteresis."""
+    w1 = h1 = w2 = h2 = 0
+    if app.plotter is not None:
+        w1, h1 = app.plotter.interactor.width(), app.plotter.interactor.height()
+    if app.plotter_ref is not None and app.plotter_ref.isVisible():
+        w2, h2 = app.plotter_ref.interactor.width(), app.plotter_ref.interactor.height()
+    rest = (split, app.current_view, id(app.cloud), id(app.cloud_ref))
+    return (w1, h1, w2, h2), rest
+
+
+def _fit_within_hysteresis(app, key) -> bool:
+    last = app._last_fit_size
+    if last is None or last[1] != key[1]:
+        return False
+    tol = app._fit_hysteresis_px
+    return all(abs(a - b) < tol for a, b in zip(last[0], key[0]))
 
 
 def fit_to_canvas(app):
-    if getattr(app, "_is_closing", False) or getattr(app, "_batch", False):
+    if app._is_closing or app._batch:
         return
 
     split = app._is_split_mode()
+    resize_only = False
+    if not app._fit_timer.isActive():  # direct calls never skip; the timer owns the flag
+        resize_only, app._fit_resize_only = app._fit_resize_only, False
+    key = _fit_size_key(app, split)
+    if resize_only and _fit_within_hysteresis(app, key):
+        return
+    app._last_fit_size = key
     shared = bool(split and app._shared_camera is not None)
 
     if shared:
-        mesh = getattr(app, "cloud", None)
+        mesh = app.cloud
         if mesh is None or mesh.n_points == 0:
-            mesh = getattr(app, "cloud_ref", None)
+            mesh = app.cloud_ref
         if mesh is None:
             return
 
@@ -241,18 +301,18 @@ def fit_to_canvas(app):
         except Exception:
             pass
 
-        if getattr(app, "_view_change_active", False):
+        if app._view_change_active:
             app._view_change_active = False
             sync_renders(app)
         else:
             sync_renders(app)
         return
 
-    if hasattr(app, "plotter"):
+    if app.plotter is not None:
         fit_view(app, app.plotter)
-    if hasattr(app, "plotter_ref") and app.plotter_ref.isVisible():
+    if app.plotter_ref is not None and app.plotter_ref.isVisible():
         fit_view(app, app.plotter_ref)
-    if getattr(app, "_view_change_active", False):
+    if app._view_change_active:
         app._view_change_active = False
         render_views_once(app)
 
@@ -267,10 +327,8 @@ def resize_event(app, event):
             w = app.nav_dock.width()
             if w >= app.nav_dock.minimumWidth():
                 app._nav_last_width = w
-    if hasattr(app, "right_title"):
-        app._position_overlays()
-    if not getattr(app, "_batch", False):
-        schedule_fit(app)
+    if not app._batch:
+        schedule_fit(app, resize=True)
 
 
 def apply_view(app, idx: int = None):
@@ -281,7 +339,7 @@ def apply_view(app, idx: int = None):
     topdown = (app.current_view == 0)
     app._view_change_active = True
     app._cam_pause = True
-    views = [getattr(app, "plotter", None), getattr(app, "plotter_ref", None)]
+    views = [app.plotter, app.plotter_ref]
     for view in views:
         if view:
             try:
@@ -293,72 +351,33 @@ def apply_view(app, idx: int = None):
         if plotter is None or mesh is None or mesh.n_points == 0:
             return
         cam = plotter.camera
-        xmin, xmax, ymin, ymax, zmin, zmax = mesh.bounds
-        cx, cy, cz = (xmin + xmax) / 2.0, (ymin + ymax) / 2.0, (zmin + zmax) / 2.0
-
-        if topdown_local:
-            cam.ParallelProjectionOn()
-            cam.SetViewUp(0, 1, 0)
-            dop = np.array([0.0, 0.0, -1.0])
-        elif app.current_view == 1:
-            cam.ParallelProjectionOn()
-            cam.SetViewUp(0, 1, 0)
-            dop = np.array([0.0, 0.0, 1.0])
-        elif app.current_view == 2:
-            cam.ParallelProjectionOff()
-            cam.SetViewUp(0, 0, 1)
-            dop = np.array([0.0, 1.0, 0.0])
-        elif app.current_view == 3:
-            cam.ParallelProjectionOff()
-            cam.SetViewUp(0, 0, 1)
-            dop = np.array([0.0, -1.0, 0.0])
-        elif app.current_view == 4:
-            cam.ParallelProjectionOff()
-            cam.SetViewUp(0, 0, 1)
-            dop = np.array([1.0, 0.0, 0.0])
-        elif app.current_view == 5:
-            cam.ParallelProjectionOff()
-            cam.SetViewUp(0, 0, 1)
-            dop = np.array([-1.0, 0.0, 0.0])
-        elif app.current_view == 6:
-            cam.ParallelProjectionOff()
-            cam.SetViewUp(0, 0, 1)
-            dop = np.array([1.0, 1.0, -1.0])
-            dop /= np.linalg.norm(dop)
-        elif app.current_view == 7:
-            cam.ParallelProjectionOff()
-            cam.SetViewUp(0, 0, 1)
-            dop = np.array([-1.0, 1.0, -1.0])
-            dop /= np.linalg.norm(dop)
-        elif app.current_view == 8:
-            cam.ParallelProjectionOff()
-            cam.SetViewUp(0, 0, 1)
-            dop = np.array([1.0, -1.0, -1.0])
-            dop /= np.linalg.norm(dop)
-        elif app.current_view == 9:
-            cam.ParallelProjectionOff()
-            cam.SetViewUp(0, 0, 1)
-            dop = np.array([-1.0, -1.0, -1.0])
-            dop /= np.linalg.norm(dop)
+        b = mesh_bounds(app, mesh)
+        center = b["center"]
+        cx, cy, cz = center
+
+        v = 0 if topdown_local else app.current_view
+        if not 0 <= v < len(_VIEW_DIRS):
+            v = len(_VIEW_DIRS) - 1
+        cam.SetParallelProjection(_VIEW_PARALLEL[v])
+        cam.SetViewUp(*_VIEW_UPS[v])
+        dop = _VIEW_DIRS[v]
 
         cam.SetFocalPoint(cx, cy, cz)
 
-        r = 0.5 * np.linalg.norm([xmax - xmin, ymax - ymin, zmax - zmin]) or 1.0
+        r = b["radius"] or 1.0
         w = max(1, plotter.interactor.width())
         h = max(1, plotter.interactor.height())
-        vfov = np.deg2rad(cam.GetViewAngle())
-        hfov = 2 * np.arctan(np.tan(vfov / 2) * (w / float(h)))
-        eff = min(vfov, hfov)
-        dist = r / np.tan(max(eff, 1e-3) / 2) * float(getattr(app, "_fit_pad", 1.12))
-        pos = np.array([cx, cy, cz]) - dop * dist
-        cam.SetPosition(*pos)
+        dist = r / _fit_half_tan(cam, w / float(h)) * app._fit_pad
+        pos = center - dop * dist
+        _set_xyz(cam.SetPosition, pos)
 
         plotter.reset_camera_clipping_range()
+        app._cam_dirty = True
 
     try:
-        _apply(app.plotter, getattr(app, "cloud", None), topdown)
-        if hasattr(app, "plotter_ref") and app.plotter_ref.isVisible():
-            _apply(app.plotter_ref, getattr(app, "cloud_ref", None), topdown)
+        _apply(app.plotter, app.cloud, topdown)
+        if app.plotter_ref is not None and app.plotter_ref.isVisible():
+            _apply(app.plotter_ref, app.cloud_ref, topdown)
     finally:
         for view in views:
             if view:
@@ -377,29 +396,68 @@ def reset_view(app) -> None:
 
 
 def sync_renders(app) -> None:
-    """Render both views safely (avoid recursion / closing / batching)."""
-    if (app._cam_syncing or getattr(app, "_is_closing", False)
-            or getattr(app, "_batch", False) or getattr(app, "_cam_pause", False)):
+    """
+    Render both views safely (avoid recursion / closing / batching).
+    No-op unless a camera or the layout changed since the last sync.
+    """
+    if app._cam_syncing or app._is_closing or app._batch or app._cam_pause:
+        return
+    if not app._cam_dirty:
         return
     app._cam_syncing = True
     try:
-        if hasattr(app, "plotter"):
+        if app.plotter is not None:
             app.plotter.render()
-        if hasattr(app, "plotter_ref") and app.plotter_ref.isVisible():
+        if app.plotter_ref is not None and app.plotter_ref.isVisible():
             app.plotter_ref.render()
+        app._cam_dirty = False
     finally:
         app._cam_syncing = False
 
 
+def _on_shared_camera_modified(app) -> None:
+    app._cam_dirty = True
+    if app._cam_syncing:
+        return
+    schedule_render(app, app.plotter, app.plotter_ref)
+
+
+def schedule_render(app, *plotters) -> None:
+    """
+    Coalesce renders: every request within _render_delay_ms of the first is
+    drawn by a single flush_render pass.
+    """
+    for plotter in plotters:
+        if plotter is not None and plotter not in app._render_pending:
+            app._render_pending.append(plotter)
+    if not app._render_timer.isActive():
+        app._render_timer.start(app._render_delay_ms)
+
+
+def flush_render(app) -> None:
+    pending, app._render_pending = app._render_pending, []
+    if not pending or app._is_closing or app._batch:
+        return
+    if app.plotter in pending and app.plotter_ref in pending:
+        sync_renders(app)
+        return
+    try:
+        for plotter in pending:
+            plotter.render()
+    except Exception:
+        pass
+
+
 def link_cameras(app) -> None:
     """Make both panels share the same vtkCamera and keep renders in sync."""
-    if not hasattr(app, "plotter") or not hasattr(app, "plotter_ref"):
+    if app.plotter is None or app.plotter_ref is None:
         return
     cam = app.plotter.renderer.GetActiveCamera()
     app.plotter_ref.renderer.SetActiveCamera(cam)
     if app._cam_observer_id is None:
         app._shared_camera = cam
-        app._cam_observer_id = cam.AddObserver("ModifiedEvent", lambda *_: sync_renders(app))
+        app._cam_observer_id = cam.AddObserver("ModifiedEvent", lambda *_: _on_shared_camera_modified(app))
+    app._cam_dirty = True
     sync_renders(app)
 
 
@@ -412,7 +470,7 @@ def unlink_cameras(app) -> None:
             pass
     app._cam_observer_id = None
     try:
-        if hasattr(app, "plotter_ref"):
+        if app.plotter_ref is not None:
             new_cam = vtkCamera()
             new_cam.DeepCopy(app.plotter.renderer.GetActiveCamera())
             app.plotter_ref.renderer.SetActiveCamera(new_cam)
@@ -427,16 +485,26 @@ def begin_batch(app) -> None:
 
     app._cam_snap_l = snap_camera(app, app.plotter)
     app._cam_snap_r = None if app._shared_cam_active() else (
-        snap_camera(app, app.plotter_ref) if app.plotter_ref.isVisible() else None
+        snap_camera(app, app.plotter_ref) if app.plotter_ref is not None and app.plotter_ref.isVisible() else None
     )
 
-    for view in [getattr(app, "plotter", None), getattr(app, "plotter_ref", None)]:
+    for view in [app.plotter, app.plotter_ref]:
         if view:
             view.interactor.setUpdatesEnabled(False)
 
 
+@contextmanager
+def batched(app):
+    """begin_batch/end_batch pair that always ends the batch, even on error."""
+    begin_batch(app)
+    try:
+        yield
+    finally:
+        end_batch(app)
+
+
 def finalize_layout(app) -> None:
-    if getattr(app, "_is_closing", False):
+    if app._is_closing:
         return
 
     app._cam_pause = True
@@ -444,15 +512,14 @@ def finalize_layout(app) -> None:
     split = app._is_split_mode()
 
     try:
-        if hasattr(app, "_cam_snap_l") and app._cam_snap_l:
-            restore_camera(app, app.plotter, app._cam_snap_l)
-
+        # apply_view overwrites the whole camera in single mode, so the
+        # snapshot only needs restoring once, in split mode.
         if split:
             cam = app.plotter.renderer.GetActiveCamera()
             app.plotter_ref.renderer.SetActiveCamera(cam)
             app._shared_camera = cam
 
-            if hasattr(app, "_cam_snap_l") and app._cam_snap_l:
+            if getattr(app, "_cam_snap_l", None):
                 restore_camera(app, app.plotter, app._cam_snap_l)
 
             if getattr(app, "_need_split_fit", False):
@@ -469,11 +536,10 @@ def finalize_layout(app) -> None:
             except Exception:
                 pass
 
-        app._position_overlays()
-
     finally:
         app._cam_pause = False
 
+    app._cam_dirty = True
     sync_renders(app)
 
     app._cam_snap_l = None
@@ -487,21 +553,27 @@ def pre_fit_camera(app, mesh, plotter) -> None:
     """
     if mesh is None or mesh.n_points == 0 or plotter is None:
         return
+    pre_fit_camera_from_bounds(app, mesh_bounds(app, mesh)["bounds"], plotter)
+
+
+def pre_fit_camera_from_bounds(app, bounds, plotter) -> None:
+    """Same as pre_fit_camera, for callers that already hold the mesh bounds."""
+    if plotter is None:
+        return
 
     cam = plotter.camera
-    xmin, xmax, ymin, ymax, zmin, zmax = mesh.bounds
+    xmin, xmax, ymin, ymax, zmin, zmax = bounds
     cx, cy, cz = (xmin + xmax) / 2.0, (ymin + ymax) / 2.0, (zmin + zmax) / 2.0
     xr, yr, zr = (xmax - xmin), (ymax - ymin), (zmax - zmin)
-    r = 0.5 * float(np.linalg.norm([xr, yr, zr])) or 1.0
+    r = 0.5 * math.sqrt(xr * xr + yr * yr + zr * zr) or 1.0
 
     w = max(1, plotter.interactor.width())
     h = max(1, plotter.interactor.height())
     aspect = w / float(h)
-    pad = float(getattr(app, "_fit_pad", 1.12))
+    pad = app._fit_pad
 
     is_parallel = app.current_view in (0, 1)
     dop = view_direction(app)
-    dop /= max(np.linalg.norm(dop), 1e-6)
 
     if is_parallel:
         cam.ParallelProjectionOn()
@@ -511,20 +583,18 @@ def pre_fit_camera(app, mesh, plotter) -> None:
         cam.SetParallelScale(max(scale_h, scale_w) * pad)
         pos = np.array([cx, cy, cz]) - dop * (r * 2.0 + 1.0)
         cam.SetFocalPoint(cx, cy, cz)
-        cam.SetPosition(*pos)
+        _set_xyz(cam.SetPosition, pos)
     else:
         cam.ParallelProjectionOff()
         cam.SetViewUp(0, 0, 1)
-        vfov = np.deg2rad(cam.GetViewAngle())
-        hfov = 2.0 * np.arctan(np.tan(vfov / 2.0) * aspect)
-        eff = max(1e-3, min(vfov, hfov))
-        dist = r / np.tan(eff / 2.0) * pad
+        dist = r / _fit_half_tan(cam, aspect) * pad
         cam.SetFocalPoint(cx, cy, cz)
-        cam.SetPosition(*(np.array([cx, cy, cz]) - dop * dist))
+        _set_xyz(cam.SetPosition, np.array([cx, cy, cz]) - dop * dist)
+    app._cam_dirty = True
 
 
 def end_batch(app) -> None:
-    for view in [getattr(app, "plotter", None), getattr(app, "plotter_ref", None)]:
+    for view in [app.plotter, app.plotter_ref]:
         if view:
             view.interactor.setUpdatesEnabled(True)
 
@@ -533,12 +603,16 @@ def end_batch(app) -> None:
     QtCore.QTimer.singleShot(0, lambda: finalize_layout(app))
 
 
-def schedule_fit(app, delay=None) -> None:
-    """Coalesce multiple fit requests into one."""
-    if getattr(app, "_is_closing", False):
+def schedule_fit(app, delay=None, resize: bool = False) -> None:
+    """
+    Coalesce multiple fit requests into one. A fit requested only by resizes
+    is skipped if the canvases moved by less than _fit_hysteresis_px.
+    """
+    if app._is_closing:
         return
-    if getattr(app, "_batch", False):
+    if app._batch:
         return
+    app._fit_resize_only = resize and (app._fit_resize_only or not app._fit_timer.isActive())
     if delay is None:
         delay = getattr(app, "_fit_delay_ms", 33)
     app._fit_timer.stop()
@@ -546,17 +620,109 @@ def schedule_fit(app, delay=None) -> None:
 
 
 def render_views_once(app) -> None:
-    if getattr(app, "_is_closing", False) or getattr(app, "_batch", False):
+    if app._is_closing or app._batch:
         return
     try:
-        if hasattr(app, "plotter"):
+        if app.plotter is not None:
             app.plotter.render()
-        if hasattr(app, "plotter_ref") and app.plotter_ref.isVisible():
+        if app.plotter_ref is not None and app.plotter_ref.isVisible():
             app.plotter_ref.render()
     except Exception:
         pass
 
 
+def _inverse_projection(app, renderer, cam):
+    """Inverse composite projection matrix, cached until the camera changes."""
+    aspect = renderer.GetTiledAspectRatio()
+    key = (id(cam), cam.GetMTime(), aspect)
+    cached = app._unproj_cache
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    buf = np.empty(16, dtype=float)
+    vtkMatrix4x4.DeepCopy(buf, cam.GetCompositeProjectionTransformMatrix(aspect, 0.0, 1.0))
+    inv = np.linalg.inv(buf.reshape(4, 4))
+    app._unproj_cache = (key, inv)
+    return inv
+
+
+def unproject_display_ray(app, renderer, cam, xd: float, yd: float):
+    """
+    World points at depth 0 and 1 under display pixel (xd, yd), i.e. what two
+    SetDisplayPoint/DisplayToWorld round-trips return, in one 4x4 @ 4x2 product.
+    """
+    w, h = renderer.GetSize()
+    ox, oy = renderer.GetOrigin()
+    xn = 2.0 * (xd - ox) / max(w, 1) - 1.0
+    yn = 2.0 * (yd - oy) / max(h, 1) - 1.0
+    ndc = np.array([[xn, xn], [yn, yn], [0.0, 1.0], [1.0, 1.0]])
+    world = _inverse_projection(app, renderer, cam) @ ndc
+    wh = world[3]
+    wh = np.where(np.abs(wh) > 1e-12, wh, 1.0)
+    pts = world[:3] / wh
+    return tuple(pts[:, 0].tolist()), tuple(pts[:, 1].tolist())
+
+
+# Scalar 3-vector helpers for the zoom path: on 3 components, plain float math
+# beats numpy's per-call overhead by an order of magnitude.
+def _sub3(a, b):
+    return (a[0] - b[0], a[1] - b[1], a[2] - b[2])
+
+
+def _add3(a, b):
+    return (a[0] + b[0], a[1] + b[1], a[2] + b[2])
+
+
+def _dot3(a, b) -> float:
+    return a[0] * b[0] + a[1] * b[1] + a[2] * b[2]
+
+
+def _unit3(v):
+    n = math.sqrt(_dot3(v, v))
+    if n < 1e-12:
+        return None
+    return (v[0] / n, v[1] / n, v[2] / n)
+
+
+def _ray_plane_point(o, d, p, n):
+    """Intersection of ray o + t*d with the plane through p normal to n, or None."""
+    denom = _dot3(d, n)
+    if abs(denom) < 1e-12:
+        return None
+    t = _dot3(_sub3(p, o), n) / denom
+    return (o[0] + d[0] * t, o[1] + d[1] * t, o[2] + d[2] * t)
+
+
+def _zoom_kernel(pos, fp, o, d, factor: float, parallel: bool):
+    """
+    Anchor-preserving zoom step. The anchor is where the cursor ray meets the
+    focal plane; returns (anchor, new_pos, new_fp).
+    """
+    n = _unit3(_sub3(fp, pos))
+    anchor = (_ray_plane_point(o, d, fp, n) if n is not None else None) or tuple(fp)
+    if parallel:
+        k = 1.0 - 1.0 / factor
+        shift = tuple((anchor[i] - fp[i]) * k for i in range(3))
+        return anchor, _add3(pos, shift), _add3(fp, shift)
+    inv = 1.0 / factor
+    new_pos = tuple(anchor[i] + (pos[i] - anchor[i]) * inv for i in range(3))
+    new_fp = tuple(anchor[i] + (fp[i] - anchor[i]) * inv for i in range(3))
+    return anchor, new_pos, new_fp
+
+
+def _anchor_pan(pos, fp, anchor, o, d):
+    """Pan that puts the anchor back under the cursor ray after a zoom step, or None."""
+    n = _unit3(_sub3(fp, pos))
+    if n is None:
+        return None
+    q = _ray_plane_point(o, d, anchor, n)
+    if q is None:
+        return None
+    pan = _sub3(anchor, q)
+    if not all(math.isfinite(c) for c in pan):
+        return None
+    return pan
+
+
 def zoom_at_cursor_for(app, plotter, x: int, y: int, delta_y: int) -> None:
     """
     Fluid, infinite zoom anchored at the cursor for a given plotter (left or right).
@@ -581,79 +747,47 @@ def zoom_at_cursor_for(app, plotter, x: int, y: int, delta_y: int) -> None:
         except Exception:
             pass
         try:
-            if hasattr(app, "plotter_ref"):
+            if app.plotter_ref is not None:
                 app.plotter_ref.interactor.setUpdatesEnabled(False)
         except Exception:
             pass
 
     try:
         def ray_through_xy(renderer, xx, yy):
-            renderer.SetDisplayPoint(float(xx), float(H - yy), 0.0)
-            renderer.DisplayToWorld()
-            x0, y0, z0, w0 = renderer.GetWorldPoint()
-            if abs(w0) > 1e-12:
-                x0, y0, z0 = x0 / w0, y0 / w0, z0 / w0
-
-            renderer.SetDisplayPoint(float(xx), float(H - yy), 1.0)
-            renderer.DisplayToWorld()
-            x1, y1, z1, w1 = renderer.GetWorldPoint()
-            if abs(w1) > 1e-12:
-                x1, y1, z1 = x1 / w1, y1 / w1, z1 / w1
-
-            o = np.array([x0, y0, z0], dtype=float)
-            d = np.array([x1, y1, z1], dtype=float) - o
-            n = float(np.linalg.norm(d))
-            if n < 1e-12:
-                o = np.array(cam.GetPosition(), dtype=float)
-                d = np.array(cam.GetFocalPoint(), dtype=float) - o
-                n = float(np.linalg.norm(d))
-            return o, (d / max(n, 1e-12))
-
-        pos0 = np.array(cam.GetPosition(), dtype=float)
-        fp0 = np.array(cam.GetFocalPoint(), dtype=float)
-        vu0 = np.array(cam.GetViewUp(), dtype=float)
-
-        n0 = fp0 - pos0
-        n0n = float(np.linalg.norm(n0))
-        if n0n < 1e-12:
+            o, p1 = unproject_display_ray(app, renderer, cam, float(xx), float(H - yy))
+            d = _unit3(_sub3(p1, o))
+            if d is None:
+                o = cam.GetPosition()
+                d = _unit3(_sub3(cam.GetFocalPoint(), o)) or (0.0, 0.0, 0.0)
+            return o, d
+
+        set_pos, set_fp, set_vu = cam.SetPosition, cam.SetFocalPoint, cam.SetViewUp
+        pos0 = cam.GetPosition()
+        fp0 = cam.GetFocalPoint()
+        vu0 = cam.GetViewUp()
+        if _unit3(_sub3(fp0, pos0)) is None:
             return
-        n0 /= n0n
-
-        o0, d0 = ray_through_xy(ren, x, y)
-        denom0 = float(np.dot(d0, n0))
-        anchor = fp0.copy() if abs(denom0) < 1e-12 else (o0 + d0 * float(np.dot(fp0 - o0, n0) / denom0))
 
         factor = 1.0 if delta_y == 0 else (1.2 ** (delta_y / 120.0))
         if factor <= 0.0:
             return
 
-        if cam.GetParallelProjection():
+        parallel = bool(cam.GetParallelProjection())
+        o0, d0 = ray_through_xy(ren, x, y)
+        anchor, pos1, fp1 = _zoom_kernel(pos0, fp0, o0, d0, factor, parallel)
+
+        if parallel:
             cam.SetParallelScale(cam.GetParallelScale() / max(1e-6, factor))
-            shift = (anchor - fp0) * (1.0 - 1.0 / factor)
-            cam.SetFocalPoint(*(fp0 + shift))
-            cam.SetPosition(*(pos0 + shift))
-            cam.SetViewUp(*vu0)
-        else:
-            cam.SetPosition(*(anchor + (pos0 - anchor) / factor))
-            cam.SetFocalPoint(*(anchor + (fp0 - anchor) / factor))
-            cam.SetViewUp(*vu0)
-
-        pos1 = np.array(cam.GetPosition(), dtype=float)
-        fp1 = np.array(cam.GetFocalPoint(), dtype=float)
-        n1 = fp1 - pos1
-        n1n = float(np.linalg.norm(n1))
-        if n1n >= 1e-12:
-            n1 /= n1n
-            o1, d1 = ray_through_xy(ren, x, y)
-            denom1 = float(np.dot(d1, n1))
-            if abs(denom1) > 1e-12:
-                t1 = float(np.dot(anchor - o1, n1) / denom1)
-                q = o1 + d1 * t1
-                pan = anchor - q
-                if np.isfinite(pan).all():
-                    cam.SetPosition(*(pos1 + pan))
-                    cam.SetFocalPoint(*(fp1 + pan))
-                    cam.SetViewUp(*vu0)
+        set_pos(*pos1)
+        set_fp(*fp1)
+        set_vu(*vu0)
+
+        o1, d1 = ray_through_xy(ren, x, y)
+        pan = _anchor_pan(pos1, fp1, anchor, o1, d1)
+        if pan is not None:
+            set_pos(*_add3(pos1, pan))
+            set_fp(*_add3(fp1, pan))
+            set_vu(*vu0)
 
     finally:
         if atomic:
@@ -662,18 +796,19 @@ def zoom_at_cursor_for(app, plotter, x: int, y: int, delta_y: int) -> None:
             except Exception:
                 pass
             try:
-                if hasattr(app, "plotter_ref"):
+                if app.plotter_ref is not None:
                     app.plotter_ref.interactor.setUpdatesEnabled(True)
             except Exception:
                 pass
             app._cam_pause = False
             app._in_zoom = False
 
+    app._cam_dirty = True
     try:
         plotter.reset_camera_clipping_range()
-        if app.repair_mode and getattr(app, "plotter_ref", None) is not None and app.plotter_ref.isVisible():
-            sync_renders(app)
+        if app.repair_mode and app.plotter_ref is not None and app.plotter_ref.isVisible():
+            schedule_render(app, app.plotter, app.plotter_ref)
         else:
-            plotter.render()
+            schedule_render(app, plotter)
     except Exception:
         pass
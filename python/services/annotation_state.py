@@ -1,22 +1,57 @@
 from __future__ import annotations
 
+import filecmp
 from pathlib import Path
 
 
+def _read_rgb(path: Path):
+    """Return (n_points, RGB array or None) without building a pv.PolyData for PLY."""
+    if path.suffix.lower() == ".ply":
+        from vtkmodules.util.numpy_support import vtk_to_numpy
+        from vtkmodules.vtkIOPLY import vtkPLYReader
+
+        reader = vtkPLYReader()
+        reader.SetFileName(str(path))
+        reader.Update()
+        poly = reader.GetOutput()
+        arr = poly.GetPointData().GetArray("RGB")
+        return poly.GetNumberOfPoints(), (vtk_to_numpy(arr) if arr is not None else None)
+
+    import pyvista as pv
+
+    pc = pv.read(str(path))
+    return pc.n_points, (pc["RGB"] if "RGB" in pc.array_names else None)
+
+
+def annotated_pair_key(ann_path: Path, orig_path: Path):
+    """Cache key for is_annotated_pair results; None if either file is missing."""
+    try:
+        sa = ann_path.stat()
+        so = orig_path.stat()
+    except OSError:
+        return None
+    return (str(ann_path), sa.st_mtime_ns, sa.st_size,
+            str(orig_path), so.st_mtime_ns, so.st_size)
+
+
 def is_annotated_pair(ann_path: Path, orig_path: Path) -> bool:
     try:
+        # Byte-identical copies cannot differ in color; skip parsing both clouds.
+        if (ann_path.stat().st_size == orig_path.stat().st_size
+                and filecmp.cmp(ann_path, orig_path, shallow=False)):
+            return False
+
         import numpy as np
-        import pyvista as pv
 
-        pc_a = pv.read(str(ann_path))
-        pc_o = pv.read(str(orig_path))
+        n_a, rgb_a = _read_rgb(ann_path)
+        n_o, rgb_o = _read_rgb(orig_path)
 
-        if pc_a.n_points != pc_o.n_points:
+        if n_a != n_o:
             return True
 
-        if "RGB" not in pc_a.array_names or "RGB" not in pc_o.array_names:
+        if rgb_a is None or rgb_o is None:
             return False
 
-        return not np.array_equal(pc_a["RGB"], pc_o["RGB"])
+        return not np.array_equal(rgb_a, rgb_o)
     except Exception:
         return False
@@ -1,20 +1,39 @@
 from __future__ import annotations
 
+import atexit
+import copy
 import json
 import logging
+import os
 from logging.handlers import RotatingFileHandler
 
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:  # optional speedup; stdlib json is the fallback
+    _json_loads = json.loads
+
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
 from configs.constants import (
     DEBUG_GUI_LOG,
     GUI_LOG_BACKUPS,
     GUI_LOG_MAX_BYTES,
     STATE_DIR,
     STATE_FILE,
+    STATE_FLUSH_DELAY_MS,
 )
 
 STATE_DIR.mkdir(parents=True, exist_ok=True)
 
 _GUI_LOGGER = None
+_STATE_CACHE: dict | None = None
+_STATE_MTIME_NS = None
+_STATE_DIRTY = False
+_STATE_FLUSH_TIMER = None
 
 
 def _get_gui_logger() -> logging.Logger:
@@ -35,6 +54,7 @@ def _get_gui_logger() -> logging.Logger:
             maxBytes=GUI_LOG_MAX_BYTES,
             backupCount=GUI_LOG_BACKUPS,
             encoding="utf-8",
+            delay=True,
         )
         formatter = logging.Formatter(
             "[%(asctime)s] %(message)s", datefmt="%Y-%m-%d %H:%M:%S"
@@ -46,11 +66,11 @@ def _get_gui_logger() -> logging.Logger:
     return logger
 
 
-def load_state() -> dict:
+def _read_state_file() -> dict:
     try:
         if not STATE_FILE.exists():
             return {}
-        state = json.loads(STATE_FILE.read_text())
+        state = _json_loads(STATE_FILE.read_bytes())
         if not isinstance(state, dict):
             return {}
         if "project_pairs" not in state:
@@ -58,34 +78,110 @@ def load_state() -> dict:
             org = state.get("original_dir", "")
             if ann and org:
                 state["project_pairs"] = {ann: org}
-                STATE_FILE.write_text(json.dumps(state))
+                STATE_FILE.write_bytes(_json_dumps(state))
         return state
     except Exception:
         return {}
 
 
-def save_state(updates: dict) -> None:
+def _state_file_mtime_ns():
     try:
-        state = load_state()
-        state.update(updates)
-        STATE_FILE.write_text(json.dumps(state))
+        return STATE_FILE.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+def _cached_state() -> dict:
+    """The in-process state dict, re-read only if the file changed on disk."""
+    global _STATE_CACHE, _STATE_MTIME_NS
+    if _STATE_CACHE is not None and _STATE_DIRTY:
+        return _STATE_CACHE
+    mtime = _state_file_mtime_ns()
+    if _STATE_CACHE is None or mtime != _STATE_MTIME_NS:
+        _STATE_CACHE = _read_state_file()
+        _STATE_MTIME_NS = _state_file_mtime_ns()
+    return _STATE_CACHE
+
+
+def load_state() -> dict:
+    """Return a copy of the persisted state (cached, revalidated by mtime)."""
+    return copy.deepcopy(_cached_state())
+
+
+def _write_state_file(state: dict) -> None:
+    global _STATE_MTIME_NS
+    tmp = STATE_FILE.with_name(STATE_FILE.name + ".tmp")
+    tmp.write_bytes(_json_dumps(state))
+    os.replace(tmp, STATE_FILE)
+    _STATE_MTIME_NS = _state_file_mtime_ns()
+
+
+def flush_state() -> None:
+    """Write pending state updates to disk now."""
+    global _STATE_DIRTY
+    if not _STATE_DIRTY or _STATE_CACHE is None:
+        return
+    try:
+        if _STATE_FLUSH_TIMER is not None:
+            _STATE_FLUSH_TIMER.stop()
+    except Exception:
+        pass
+    try:
+        _write_state_file(_STATE_CACHE)
+        _STATE_DIRTY = False
     except Exception:
         pass
 
 
-def load_nav_dock_width(default_width: int) -> int:
+def _schedule_state_flush() -> None:
+    global _STATE_FLUSH_TIMER
     try:
-        state = load_state()
-        return int(state.get("nav_dock_width", default_width))
+        from PyQt5 import QtCore
+
+        if QtCore.QCoreApplication.instance() is None:
+            flush_state()
+            return
+        if _STATE_FLUSH_TIMER is None:
+            _STATE_FLUSH_TIMER = QtCore.QTimer()
+            _STATE_FLUSH_TIMER.setSingleShot(True)
+            _STATE_FLUSH_TIMER.timeout.connect(flush_state)
+        _STATE_FLUSH_TIMER.start(STATE_FLUSH_DELAY_MS)
     except Exception:
-        return default_width
+        flush_state()
 
 
-def log_gui(message: str) -> None:
+def save_state(updates: dict) -> None:
+    """Merge updates into the cached state; the disk write is debounced."""
+    global _STATE_DIRTY
     try:
-        if not DEBUG_GUI_LOG:
+        state = _cached_state()
+        if all(k in state and state[k] == v for k, v in updates.items()):
             return
-        logger = _get_gui_logger()
-        logger.info(message)
+        state.update(copy.deepcopy(updates))
+        _STATE_DIRTY = True
+        _schedule_state_flush()
     except Exception:
         pass
+
+
+atexit.register(flush_state)
+
+
+def load_nav_dock_width(default_width: int) -> int:
+    try:
+        return int(_cached_state().get("nav_dock_width", default_width))
+    except Exception:
+        return default_width
+
+
+if DEBUG_GUI_LOG:
+    def log_gui(message: str) -> None:
+        try:
+            logger = _get_gui_logger()
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(message)
+        except Exception:
+            pass
+else:
+    def log_gui(message: str) -> None:
+        """GUI debug logging is disabled; calls are free."""
@@ -1,22 +1,31 @@
 from __future__ import annotations
 
+import contextlib
 import hashlib
 import os
+import sqlite3
+import struct
 import threading
+import time
 from pathlib import Path
 
 import numpy as np
 import pyvista as pv
-from joblib import Parallel, delayed
-from PIL import Image
+from joblib import Parallel, delayed, parallel_backend
 from PyQt5 import QtCore, QtWidgets
-from PyQt5.QtGui import QIcon, QPixmap
+from PyQt5.QtGui import QPixmap
+from vtkmodules.vtkIOImage import vtkPNGWriter
+from vtkmodules.vtkRenderingCore import vtkWindowToImageFilter
 
 from configs.constants import (
     PERCENTAGE_CORE_FACTOR,
     THUMB_BACKEND,
+    THUMB_BATCH_WAIT_S,
     THUMB_DIR,
+    THUMB_INDEX_FILE,
     THUMB_MAX_PTS,
+    THUMB_MIN_BATCH,
+    THUMB_PNG_COMPRESS_LEVEL,
     THUMB_SIZE,
 )
 from services.storage import log_gui
@@ -24,6 +33,71 @@ from services.storage import log_gui
 THUMB_DIR.mkdir(parents=True, exist_ok=True)
 thumb_n_jobs = max(1, int((os.cpu_count() or 1) * PERCENTAGE_CORE_FACTOR))
 
+# One warm off-screen plotter per worker thread (or process): creating the
+# render window and GL context costs more than rendering a small cloud.
+# Thread workers release theirs at the end of each run (see _drain_jobs);
+# loky worker processes are reused across runs and keep at most one each.
+_WORKER_LOCAL = threading.local()
+
+
+def _worker_plotter(size: int):
+    plotter = getattr(_WORKER_LOCAL, "plotter", None)
+    if plotter is not None and tuple(plotter.window_size) == (size, size):
+        plotter.clear()
+        return plotter
+    if plotter is not None:
+        _release_worker_plotter()
+    plotter = pv.Plotter(off_screen=True, window_size=(size, size))
+    plotter.set_background("white")
+    _WORKER_LOCAL.plotter = plotter
+    return plotter
+
+
+def _release_worker_plotter() -> None:
+    """Close the calling thread's plotter, if any. Must run on that thread."""
+    plotter = getattr(_WORKER_LOCAL, "plotter", None)
+    _WORKER_LOCAL.plotter = None
+    if plotter is None:
+        return
+    try:
+        plotter.close()
+    except Exception:
+        pass
+
+
+def _write_window_png(plotter, out_png: Path) -> None:
+    """
+    Encode the plotter's render window straight to PNG in VTK, skipping the
+    numpy screenshot copy and the PIL encode.
+    """
+    grab = vtkWindowToImageFilter()
+    grab.SetInput(plotter.ren_win)
+    grab.SetInputBufferTypeToRGB()
+    grab.ReadFrontBufferOff()
+    writer = vtkPNGWriter()
+    writer.SetCompressionLevel(THUMB_PNG_COMPRESS_LEVEL)
+    writer.SetFileName(str(out_png))
+    writer.SetInputConnection(grab.GetOutputPort())
+    writer.Write()
+
+
+_KEY_TAIL = struct.Struct("<Qq")   # st_size, st_mtime_ns
+
+
+def thumb_key_for_file(src: Path, st: os.stat_result | None = None, resolved: str | None = None) -> str:
+    """
+    Cache filename stem for a source file. The key is a fingerprint, not a
+    security boundary, so BLAKE2b (faster than SHA-1 in hashlib) is enough.
+    """
+    if st is None:
+        st = src.stat()
+    if resolved is None:
+        resolved = str(src.resolve())
+    # One payload, one update: same bytes (and digest) as feeding the parts
+    # separately, without the intermediate bytes objects.
+    payload = resolved.encode("utf-8") + _KEY_TAIL.pack(st.st_size, st.st_mtime_ns)
+    return hashlib.blake2b(payload, digest_size=20).hexdigest()
+
 
 def generate_thumbnail_job(path: Path, out_png: Path, size: int = THUMB_SIZE) -> None:
     """
@@ -36,16 +110,23 @@ def generate_thumbnail_job(path: Path, out_png: Path, size: int = THUMB_SIZE) ->
         log_gui(f"thumb_generate: src={path} out={out_png}")
 
         pc = pv.read(str(path))
-        if pc.n_points == 0:
+        n = pc.n_points
+        if n == 0:
             return
-        if pc.n_points > THUMB_MAX_PTS:
-            idx = np.linspace(0, pc.n_points - 1, THUMB_MAX_PTS).astype(int)
-            pc = pc.extract_points(idx)
-
-        plotter = pv.Plotter(off_screen=True, window_size=(size, size))
-        plotter.set_background("white")
-
-        if "RGB" in pc.array_names:
+        has_rgb = "RGB" in pc.array_names
+        pts = np.asarray(pc.points)
+        if n > THUMB_MAX_PTS:
+            # Plain gather of points/RGB; extract_points would also build cells.
+            idx = np.linspace(0, n - 1, THUMB_MAX_PTS, dtype=np.int64)
+            pts = pts[idx]
+            small = pv.PolyData(pts)
+            if has_rgb:
+                small["RGB"] = np.asarray(pc["RGB"])[idx]
+            pc = small
+
+        plotter = _worker_plotter(size)
+
+        if has_rgb:
             plotter.add_points(pc, scalars="RGB", rgb=True, point_size=4)
         else:
             plotter.add_points(pc, color="gray", point_size=4)
@@ -55,7 +136,8 @@ def generate_thumbnail_job(path: Path, out_png: Path, size: int = THUMB_SIZE) ->
         cam.ParallelProjectionOn()
         cam.SetViewUp(0, 1, 0)
 
-        xmin, xmax, ymin, ymax, zmin, zmax = pc.bounds
+        # Frame from the (possibly subsampled) points that are actually drawn.
+        (xmin, ymin, zmin), (xmax, ymax, zmax) = pts.min(axis=0).tolist(), pts.max(axis=0).tolist()
         cx = 0.5 * (xmin + xmax)
         cy = 0.5 * (ymin + ymax)
         cz = 0.5 * (zmin + zmax)
@@ -69,33 +151,88 @@ def generate_thumbnail_job(path: Path, out_png: Path, size: int = THUMB_SIZE) ->
 
         plotter.reset_camera_clipping_range()
 
-        img = plotter.screenshot(transparent_background=False)
-        plotter.close()
-
-        img = img[:, :, :3].astype(np.uint8)
-        Image.fromarray(img).save(out_png)
+        plotter.render()
+        _write_window_png(plotter, out_png)
         log_gui(f"thumb_generate_done: out={out_png} ok={out_png.exists()}")
 
     except Exception:
         pass
 
 
+def _open_key_index():
+    """
+    SQLite memo of (source path -> size, mtime_ns, key), so a restart does not
+    re-resolve and re-hash every file. Lives outside THUMB_DIR, which gets
+    deleted wholesale by clear_thumbnail_cache. None if unavailable.
+    """
+    try:
+        db = sqlite3.connect(str(THUMB_INDEX_FILE))
+        db.execute(
+            "CREATE TABLE IF NOT EXISTS thumb_keys ("
+            "src TEXT PRIMARY KEY, size INTEGER, mtime_ns INTEGER, key TEXT)"
+        )
+        db.commit()
+        return db
+    except Exception as exc:
+        log_gui(f"thumb_index_open_failed: err={exc}")
+        return None
+
+
+def _unlink_quiet(path: Path) -> None:
+    try:
+        path.unlink()
+    except Exception:
+        pass
+
+
+def _scan_thumb_keys() -> set:
+    """Keys of every PNG in THUMB_DIR, from a single directory scan."""
+    try:
+        with os.scandir(THUMB_DIR) as it:
+            return {e.name[:-4] for e in it if e.name.endswith(".png")}
+    except OSError:
+        return set()
+
+
+class _PollBridge(QtCore.QObject):
+    """Carries poll results from the scan thread back to the UI thread."""
+    ready = QtCore.pyqtSignal(list)
+
+
 class ThumbnailService:
     def __init__(self, app, nav_thumb_size: int):
         self.app = app
         self.nav_thumb_size = nav_thumb_size
         self._thumb_lock = threading.Lock()
         self._thumb_job_set = set()        # (src_path, out_png)
+        self._thumb_in_flight = set()      # jobs taken by the worker, not yet rendered
         self._thumb_out_by_idx = {}        # idx -> out_png
         self._thumb_worker_running = False
         self._thumb_worker_start_pending = False
         self._thumb_generation = 0
         self._thumb_batch_size = 12
+        self._key_cache = {}               # str(src) -> (st_size, st_mtime_ns, key)
+        self._key_rows_pending = []        # new _key_cache rows not yet in the index
+        self._resolve_cache = {}           # str(src) -> str(src.resolve())
+        self._key_db = _open_key_index()
+        if self._key_db is not None:
+            try:
+                for src, size, mtime_ns, key in self._key_db.execute(
+                    "SELECT src, size, mtime_ns, key FROM thumb_keys"
+                ):
+                    self._key_cache[src] = (size, mtime_ns, key)
+            except Exception:
+                pass
+        self._known_thumbs = _scan_thumb_keys()
+        self._poll_busy = False
+        self._poll_bridge = _PollBridge(app)
+        self._poll_bridge.ready.connect(self._apply_poll_updates)
 
     def reset_queue(self) -> None:
         with self._thumb_lock:
             self._thumb_out_by_idx = {}
             self._thumb_job_set.clear()
+        self._resolve_cache.clear()
 
     def new_generation(self) -> None:
         """Cancel current thumbnail batch and start a new generation."""
@@ -123,13 +260,15 @@ class ThumbnailService:
             orig_key = self._thumb_key_for_path(orig)
             if ann_key == orig_key:
                 continue
-            ann_png = THUMB_DIR / f"{ann_key}.png"
-            if ann_png.exists():
-                try:
-                    ann_png.unlink()
-                    removed += 1
-                except Exception:
-                    pass
+            if ann_key not in self._known_thumbs:
+                continue
+            try:
+                (THUMB_DIR / f"{ann_key}.png").unlink()
+                removed += 1
+            except Exception:
+                pass
+            self._known_thumbs.discard(ann_key)
+            self.invalidate_key(ann_path)
         if removed:
             log_gui(f"thumb_prune_ann: removed={removed}")
 
@@ -137,12 +276,57 @@ class ThumbnailService:
         return len(self._thumb_out_by_idx)
 
     def _thumb_key_for_path(self, src: Path) -> str:
+        """thumb_key_for_file, memoized until the file's size or mtime changes."""
         st = src.stat()
-        h = hashlib.sha1()
-        h.update(str(src.resolve()).encode("utf-8"))
-        h.update(str(st.st_size).encode("utf-8"))
-        h.update(str(int(st.st_mtime)).encode("utf-8"))
-        return h.hexdigest()
+        cache_key = str(src)
+        cached = self._key_cache.get(cache_key)
+        if cached is not None and cached[0] == st.st_size and cached[1] == st.st_mtime_ns:
+            return cached[2]
+        resolved = self._resolve_cache.get(cache_key)
+        if resolved is None:
+            # resolve() opens the file on Windows; slow on UNC shares.
+            resolved = self._resolve_cache[cache_key] = str(src.resolve())
+        key = thumb_key_for_file(src, st, resolved)
+        self._key_cache[cache_key] = (st.st_size, st.st_mtime_ns, key)
+        self._key_rows_pending.append((cache_key, st.st_size, st.st_mtime_ns, key))
+        return key
+
+    def _key_index_exec(self, sql: str, rows=None) -> None:
+        if self._key_db is None:
+            return
+        try:
+            with self._key_db:
+                if rows is None:
+                    self._key_db.execute(sql)
+                else:
+                    self._key_db.executemany(sql, rows)
+        except Exception as exc:
+            log_gui(f"thumb_index_write_failed: err={exc}")
+
+    def flush_key_index(self) -> None:
+        """Persist newly computed keys in one transaction."""
+        if not self._key_rows_pending:
+            return
+        rows, self._key_rows_pending = self._key_rows_pending, []
+        self._key_index_exec(
+            "INSERT OR REPLACE INTO thumb_keys (src, size, mtime_ns, key) VALUES (?, ?, ?, ?)",
+            rows,
+        )
+
+    def _thumb_key_or_none(self, ann_path: Path):
+        try:
+            return self.thumb_key(ann_path)
+        except OSError:
+            return None
+
+    def invalidate_key(self, path: Path) -> None:
+        self._forget_keys([str(path)])
+
+    def _forget_keys(self, srcs) -> None:
+        for src in srcs:
+            self._key_cache.pop(src, None)
+        self._key_rows_pending = [r for r in self._key_rows_pending if r[0] not in srcs]
+        self._key_index_exec("DELETE FROM thumb_keys WHERE src = ?", [(src,) for src in srcs])
 
     def thumb_key(self, ann_path: Path) -> str:
         """
@@ -166,7 +350,10 @@ class ThumbnailService:
         return THUMB_DIR / f"{self._thumb_key_for_path(path)}.png"
 
     def thumb_exists(self, path: Path) -> bool:
-        return self.thumb_path(path).exists()
+        return self.thumb_key(path) in self._known_thumbs
+
+    def _mark_thumb_written(self, key: str) -> None:
+        self._known_thumbs.add(key)
 
     def request_thumbnail(self, idx: int) -> None:
         """
@@ -187,13 +374,16 @@ class ThumbnailService:
             src_path = ann_path
 
         out_png = self.thumb_path(ann_path)
-        if out_png.exists():
+        if out_png.stem in self._known_thumbs:
             log_gui(f"thumb_cache_hit: idx={idx} out={out_png}")
             return
 
+        job = (src_path, out_png)
         with self._thumb_lock:
             self._thumb_out_by_idx[idx] = out_png
-            self._thumb_job_set.add((src_path, out_png))
+            if job in self._thumb_in_flight:
+                return
+            self._thumb_job_set.add(job)
 
         log_gui(f"thumb_queued: idx={idx} src={src_path} out={out_png}")
 
@@ -210,41 +400,110 @@ class ThumbnailService:
         gen = self._thumb_generation
         log_gui(f"thumb_worker_start: gen={gen}")
 
+        # Each job is a full VTK render, so only bunch jobs when the batch
+        # is large relative to the worker count.
+        dispatch_batch = max(1, min(16, self._thumb_batch_size // (4 * thumb_n_jobs)))
+
         def worker():
             try:
+                if THUMB_BACKEND == "threading":
+                    self._run_threaded(gen)
+                else:
+                    run_batched()
+            finally:
+                self._thumb_worker_running = False
+                log_gui(f"thumb_worker_end: gen={gen}")
+
+        def run_batched():
+            if THUMB_BACKEND == "loky":
+                # Cap BLAS/OpenMP threads inside each worker process. Entered
+                # here because joblib's backend config is thread-local.
+                backend_ctx = parallel_backend("loky", inner_max_num_threads=1)
+            else:
+                backend_ctx = contextlib.nullcontext()
+            # One Parallel for the whole run, so the pool is reused across batches.
+            with backend_ctx, Parallel(
+                n_jobs=thumb_n_jobs,
+                backend=None if THUMB_BACKEND == "loky" else THUMB_BACKEND,
+                batch_size=dispatch_batch,
+                pre_dispatch="2*n_jobs",
+                verbose=0
+            ) as parallel:
                 while True:
                     with self._thumb_lock:
                         if gen != self._thumb_generation:
                             break
                         jobs = list(self._thumb_job_set)
                         self._thumb_job_set.clear()
+                        self._thumb_in_flight.update(jobs)
 
                     if not jobs:
                         break
 
-                    while jobs:
-                        if gen != self._thumb_generation:
-                            return
-                        batch = jobs[:self._thumb_batch_size]
-                        jobs = jobs[self._thumb_batch_size:]
-                        Parallel(
-                            n_jobs=thumb_n_jobs,
-                            backend=THUMB_BACKEND,
-                            verbose=0
-                        )(
-                            delayed(generate_thumbnail_job)(src, out, THUMB_SIZE)
-                            for src, out in batch
-                        )
-            finally:
-                self._thumb_worker_running = False
-                log_gui(f"thumb_worker_end: gen={gen}")
+                    if len(jobs) < THUMB_MIN_BATCH:
+                        # Requests trickle in while the nav list scrolls or
+                        # populates; give them a moment to pile up so one
+                        # dispatch covers them instead of many tiny ones.
+                        time.sleep(THUMB_BATCH_WAIT_S)
+                        with self._thumb_lock:
+                            if gen == self._thumb_generation:
+                                more = list(self._thumb_job_set)
+                                self._thumb_job_set.clear()
+                                self._thumb_in_flight.update(more)
+                                jobs.extend(more)
+
+                    try:
+                        while jobs:
+                            if gen != self._thumb_generation:
+                                return
+                            batch = jobs[:self._thumb_batch_size]
+                            parallel(
+                                delayed(generate_thumbnail_job)(src, out, THUMB_SIZE)
+                                for src, out in batch
+                            )
+                            jobs = jobs[self._thumb_batch_size:]
+                            with self._thumb_lock:
+                                self._thumb_in_flight.difference_update(batch)
+                    finally:
+                        # Jobs dropped by a generation change may be requested again.
+                        with self._thumb_lock:
+                            self._thumb_in_flight.difference_update(jobs)
 
         threading.Thread(target=worker, daemon=True).start()
 
-    def thumb_icon_for_index(self, idx: int):
+    def _run_threaded(self, gen: int) -> None:
+        """
+        Threading backend: every pool thread pulls jobs itself (_drain_jobs)
+        so it keeps one warm plotter for the whole run and closes it before
+        joblib tears the pool down. Repeats while jobs arrived meanwhile.
+        """
+        with Parallel(n_jobs=thumb_n_jobs, backend="threading", verbose=0) as parallel:
+            while True:
+                with self._thumb_lock:
+                    if gen != self._thumb_generation or not self._thumb_job_set:
+                        return
+                parallel(delayed(self._drain_jobs)(gen) for _ in range(thumb_n_jobs))
+
+    def _drain_jobs(self, gen: int) -> None:
+        try:
+            while True:
+                with self._thumb_lock:
+                    if gen != self._thumb_generation or not self._thumb_job_set:
+                        return
+                    job = self._thumb_job_set.pop()
+                    self._thumb_in_flight.add(job)
+                try:
+                    generate_thumbnail_job(job[0], job[1], THUMB_SIZE)
+                finally:
+                    with self._thumb_lock:
+                        self._thumb_in_flight.discard(job)
+        finally:
+            _release_worker_plotter()
+
+    def thumb_pixmap_for_index(self, idx: int, size: int = THUMB_SIZE):
         """
-        Return QIcon for thumbnail if available, else None.
-        UI-safe (Qt only, no disk generation).
+        Return the thumbnail QPixmap at `size` if available, else None.
+        Thumbnails are rendered at THUMB_SIZE, so usually no rescale is needed.
         """
         try:
             path = self.app.files[idx]
@@ -253,69 +512,68 @@ class ThumbnailService:
                 if not orig.exists():
                     return None
             png = self.thumb_path(path)
-            if not png.exists():
+            if png.stem not in self._known_thumbs:
                 return None
             pix = QPixmap(str(png))
             if pix.isNull():
                 return None
-            pix = pix.scaled(
-                THUMB_SIZE, THUMB_SIZE,
-                QtCore.Qt.KeepAspectRatio,
-                QtCore.Qt.SmoothTransformation
-            )
-            return QIcon(pix)
+            if pix.width() != size or pix.height() != size:
+                pix = pix.scaled(
+                    size, size,
+                    QtCore.Qt.KeepAspectRatio,
+                    QtCore.Qt.SmoothTransformation
+                )
+            return pix
         except Exception:
             return None
 
     def refresh_nav_thumbnail(self, idx: int) -> None:
-        if getattr(self.app, "_nav_fast_mode", False):
-            if not hasattr(self.app, "nav_list"):
-                return
-            icon = self.thumb_icon_for_index(idx)
-            if icon is None:
-                return
-            item = self.app.nav_list.item(idx)
-            if item is None:
-                return
-            item.setIcon(icon)
-            return
-
-        entry = self.app._nav_item_widgets.get(idx)
-        if entry is None:
-            return
-        lbl = entry["img"]
-        if lbl is None:
-            return
-
-        icon = self.thumb_icon_for_index(idx)
-        if icon is None:
-            return
-
-        pix = icon.pixmap(self.nav_thumb_size, self.nav_thumb_size)
-        lbl.setPixmap(pix)
+        # The model reloads the pixmap only if the row is painted again.
+        if hasattr(self.app, "nav_model"):
+            self.app.nav_model.thumbnail_ready(idx)
 
     def poll_thumbnails(self) -> None:
-        """Refresh UI icons when thumbnail files appear on disk."""
+        """
+        Refresh UI icons when thumbnail files appear on disk. The directory
+        scan runs off the UI thread; _apply_poll_updates gets the result.
+        """
         with self._thumb_lock:
-            pending = list(self._thumb_out_by_idx.items())
+            pending = list(self._thumb_out_by_idx.items())[:60]
 
-        updated = []
-        for idx, out_png in pending[:60]:
-            if out_png.exists():
-                updated.append(idx)
+        if pending and not self._poll_busy:
+            self._poll_busy = True
+            threading.Thread(target=self._scan_pending, args=(pending,), daemon=True).start()
 
-        if updated:
-            with self._thumb_lock:
-                for idx in updated:
-                    self._thumb_out_by_idx.pop(idx, None)
+        self.flush_key_index()
+        self.app._update_status_bar()
 
-            for idx in updated:
-                self.refresh_nav_thumbnail(idx)
+    def _scan_pending(self, pending) -> None:
+        """Worker thread: one scandir, no Qt calls except the queued signal."""
+        try:
+            # One directory scan instead of a stat per pending thumbnail.
+            present = _scan_thumb_keys()
+            ready = [(idx, out_png) for idx, out_png in pending if out_png.stem in present]
+        except Exception:
+            ready = []
+        self._poll_bridge.ready.emit(ready)
 
-            if hasattr(self.app, "nav_list"):
-                self.app.nav_list.viewport().update()
+    def _apply_poll_updates(self, ready) -> None:
+        self._poll_busy = False
+        if not ready:
+            return
 
-        self.app._update_status_bar()
+        updated = []
+        with self._thumb_lock:
+            for idx, out_png in ready:
+                # Skip rows requeued for another file (e.g. after a folder switch).
+                if self._thumb_out_by_idx.get(idx) == out_png:
+                    self._thumb_out_by_idx.pop(idx, None)
+                    updated.append(idx)
+        for _, out_png in ready:
+            self._mark_thumb_written(out_png.stem)
+
+        for idx in updated:
+            self.refresh_nav_thumbnail(idx)
 
     def clear_thumbnail_cache(self) -> None:
         if not THUMB_DIR.exists():
@@ -342,6 +600,10 @@ class ThumbnailService:
                 shutil.rmtree(THUMB_DIR)
 
             THUMB_DIR.mkdir(parents=True, exist_ok=True)
+            self._key_cache.clear()
+            self._key_rows_pending = []
+            self._key_index_exec("DELETE FROM thumb_keys")
+            self._known_thumbs.clear()
 
         except Exception as e:
             QtWidgets.QMessageBox.warning(
@@ -349,17 +611,8 @@ class ThumbnailService:
             )
             return
 
-        if hasattr(self.app, "_nav_item_widgets"):
-            for entry in self.app._nav_item_widgets.values():
-                entry["img"].clear()
-        if getattr(self.app, "_nav_fast_mode", False):
-            try:
-                for i in range(self.app.nav_list.count()):
-                    item = self.app.nav_list.item(i)
-                    if item is not None:
-                        item.setIcon(QIcon())
-            except Exception:
-                pass
+        if hasattr(self.app, "nav_model"):
+            self.app.nav_model.clear_thumbnails()
 
         QtWidgets.QMessageBox.information(
             self.app, "Thumbnail Cache", "Thumbnail cache cleared."
@@ -369,13 +622,24 @@ class ThumbnailService:
         if self.app.orig_dir is None or not THUMB_DIR.exists():
             return
 
-        valid_keys = set()
-        for p in self.app.orig_dir.glob("*.ply"):
-            valid_keys.add(self.thumb_key(p))
-
-        for thumb in THUMB_DIR.glob("*.png"):
-            if thumb.stem not in valid_keys:
-                try:
-                    thumb.unlink()
-                except Exception:
-                    pass
+        # Key computation and deletes are stat/unlink bound (slow on network
+        # shares), so fan them out over threads; the GIL is released in syscalls.
+        io_pool = Parallel(n_jobs=thumb_n_jobs * 2, backend="threading")
+        keys = io_pool(delayed(self._thumb_key_or_none)(p) for p in self.app.orig_dir.glob("*.ply"))
+        valid_keys = {k for k in keys if k is not None}
+
+        self._known_thumbs = _scan_thumb_keys()
+        stale = self._known_thumbs - valid_keys
+        if stale:
+            io_pool(delayed(_unlink_quiet)(THUMB_DIR / f"{key}.png") for key in stale)
+        self._known_thumbs &= valid_keys
+
+        # Drop memoized keys for files that left the folder.
+        orig_dir = str(self.app.orig_dir)
+        gone = {
+            cache_key for cache_key, entry in self._key_cache.items()
+            if entry[2] not in valid_keys and str(Path(cache_key).parent) == orig_dir
+        }
+        if gone:
+            self._forget_keys(gone)
+        self.flush_key_index()
@@ -14,7 +14,7 @@ ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(ROOT))
 
 from configs.constants import STATE_FILE, THUMB_DIR
-from services.thumbnail import generate_thumbnail_job
+from services.thumbnail import generate_thumbnail_job, thumb_key_for_file
 
 DATASETS = {
     "A": {
@@ -40,14 +40,7 @@ def _get_files(folder: Path) -> list[Path]:
 
 
 def _thumb_key_for_path(src: Path) -> str:
-    st = src.stat()
-    import hashlib
-
-    h = hashlib.sha1()
-    h.update(str(src.resolve()).encode("utf-8"))
-    h.update(str(st.st_size).encode("utf-8"))
-    h.update(str(int(st.st_mtime)).encode("utf-8"))
-    return h.hexdigest()
+    return thumb_key_for_file(src)
 
 
 def _expected_keys_for_dataset(name: str) -> tuple[list[Path], list[str], list[str]]:
@@ -12,7 +12,7 @@ sys.path.insert(0, str(ROOT))
 
 from configs.constants import STATE_FILE, THUMB_DIR
 from services.storage import load_state, save_state
-from services.thumbnail import generate_thumbnail_job
+from services.thumbnail import generate_thumbnail_job, thumb_key_for_file
 
 DATASETS = {
     "A": {
@@ -54,13 +54,7 @@ def _get_sorted_files(folder: Path) -> list[Path]:
 
 
 def _thumb_key_for_path(src: Path) -> str:
-    import hashlib
-    st = src.stat()
-    h = hashlib.sha1()
-    h.update(str(src.resolve()).encode("utf-8"))
-    h.update(str(st.st_size).encode("utf-8"))
-    h.update(str(int(st.st_mtime)).encode("utf-8"))
-    return h.hexdigest()
+    return thumb_key_for_file(src)
 
 
 def _thumb_out_for(ann_path: Path, orig_dir: Path | None) -> tuple[Path, Path]:
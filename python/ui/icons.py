@@ -1,10 +1,30 @@
 from __future__ import annotations
 
+import functools
 from pathlib import Path
 
 from PyQt5 import QtCore, QtWidgets
 from PyQt5.QtGui import QColor, QIcon, QPainter, QPen, QPixmap
 
+_ICON_DIR = Path(__file__).resolve().parent.parent / "icons"
+
+
+def _cached_icon(fn):
+    """
+    Memoize an icon factory per widget style class (the only thing `app`
+    contributes), so each painter or file load runs once per process.
+    """
+    cache = {}
+
+    @functools.wraps(fn)
+    def wrapper(app, *args, **kwargs):
+        key = (type(app.style()).__name__, args, tuple(sorted(kwargs.items())))
+        icon = cache.get(key)
+        if icon is None:
+            icon = cache[key] = fn(app, *args, **kwargs)
+        return icon
+    return wrapper
+
 
 def _make_icon(size, draw_fn):
     pix = QPixmap(size, size)
@@ -17,7 +37,7 @@ def _make_icon(size, draw_fn):
 
 
 def _icon_from_file(filename):
-    icon_path = Path(__file__).resolve().parent.parent / "icons" / filename
+    icon_path = _ICON_DIR / filename
     if not icon_path.exists():
         return None
     icon = QIcon(str(icon_path))
@@ -26,6 +46,7 @@ def _icon_from_file(filename):
     return icon
 
 
+@_cached_icon
 def icon_pencil(app):
     icon = _icon_from_file("annotate.png")
     if icon is not None:
@@ -41,6 +62,7 @@ def icon_pencil(app):
     return _make_icon(16, draw)
 
 
+@_cached_icon
 def icon_eraser(app):
     icon = _icon_from_file("eraser.png")
     if icon is not None:
@@ -55,6 +77,7 @@ def icon_eraser(app):
     return _make_icon(16, draw)
 
 
+@_cached_icon
 def icon_repair(app):
     icon = _icon_from_file("repair.png")
     if icon is not None:
@@ -69,6 +92,7 @@ def icon_repair(app):
     return _make_icon(16, draw)
 
 
+@_cached_icon
 def icon_clone(app):
     icon = _icon_from_file("clone.png")
     if icon is not None:
@@ -82,6 +106,7 @@ def icon_clone(app):
     return _make_icon(16, draw)
 
 
+@_cached_icon
 def icon_palette(app):
     def draw(p, s):
         p.setPen(QPen(QColor("#2b2b2b"), 1.2))
@@ -96,6 +121,7 @@ def icon_palette(app):
     return _make_icon(16, draw)
 
 
+@_cached_icon
 def icon_contrast(app):
     icon = _icon_from_file("contrast.png")
     if icon is not None:
@@ -113,6 +139,7 @@ def icon_contrast(app):
     return _make_icon(16, draw)
 
 
+@_cached_icon
 def icon_reset_view(app):
     icon = _icon_from_file("reset.png")
     if icon is not None:
@@ -120,6 +147,7 @@ def icon_reset_view(app):
     return app.style().standardIcon(QtWidgets.QStyle.SP_DialogResetButton)
 
 
+@_cached_icon
 def icon_hist(app):
     icon = _icon_from_file("histogram.png")
     if icon is not None:
@@ -136,6 +164,7 @@ def icon_hist(app):
     return _make_icon(16, draw)
 
 
+@_cached_icon
 def icon_prev(app):
     icon = _icon_from_file("previous.png")
     if icon is not None:
@@ -143,6 +172,7 @@ def icon_prev(app):
     return app.style().standardIcon(QtWidgets.QStyle.SP_ArrowBack)
 
 
+@_cached_icon
 def icon_next(app):
     icon = _icon_from_file("next.png")
     if icon is not None:
@@ -150,6 +180,7 @@ def icon_next(app):
     return app.style().standardIcon(QtWidgets.QStyle.SP_ArrowForward)
 
 
+@_cached_icon
 def icon_loop(app):
     icon = _icon_from_file("loop.png")
     if icon is not None:
@@ -157,6 +188,7 @@ def icon_loop(app):
     return app.style().standardIcon(QtWidgets.QStyle.SP_BrowserReload)
 
 
+@_cached_icon
 def icon_reset_contrast(app):
     icon = _icon_from_file("reset-contrast.png")
     if icon is not None:
@@ -164,6 +196,7 @@ def icon_reset_contrast(app):
     return app.style().standardIcon(QtWidgets.QStyle.SP_DialogResetButton)
 
 
+@_cached_icon
 def icon_eye(app):
     icon = _icon_from_file("view.png")
     if icon is not None:
@@ -178,6 +211,7 @@ def icon_eye(app):
     return _make_icon(16, draw)
 
 
+@_cached_icon
 def icon_zoom(app, plus=True):
     if plus:
         icon = _icon_from_file("zoom-in.png")
@@ -197,8 +231,20 @@ def icon_zoom(app, plus=True):
     return _make_icon(16, draw)
 
 
+@_cached_icon
 def icon_revision(app):
     icon = _icon_from_file("revision.png")
     if icon is not None:
         return icon
     return app.style().standardIcon(QtWidgets.QStyle.SP_DriveFDIcon)
+
+
+@_cached_icon
+def icon_color_pick(app):
+    return _icon_from_file("color-pick.png")
+
+
+@_cached_icon
+def icon_standard(app, sp):
+    """Style standard pixmap `sp` (QStyle.SP_*) as an icon."""
+    return app.style().standardIcon(sp)
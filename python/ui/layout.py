@@ -3,6 +3,8 @@ from __future__ import annotations
 from PyQt5 import QtCore, QtWidgets
 from pyvistaqt import QtInteractor
 
+from ui.overlays import VIEW_TITLE_ANNOTATED, VIEW_TITLE_ORIGINAL, add_view_title
+
 
 def install_ribbon_toolbar(app) -> None:
     """Put the ribbon in QMainWindow's toolbar area so docks sit below it."""
@@ -37,10 +39,9 @@ def build_ui(app) -> None:
     lay.setContentsMargins(0, 0, 0, 0)
     lay.setSpacing(0)
 
-    app.plotter_ref = QtInteractor(app)
-    app.plotter_ref.set_background("white")
-    app.plotter_ref.setVisible(False)
-    lay.addWidget(app.plotter_ref.interactor, stretch=4)
+    # The Original view (plotter_ref) is built on first split,
+    # by ensure_ref_plotter; until then plotter_ref stays None.
+    app._central_layout = lay
 
     app.vline = QtWidgets.QFrame()
     app.vline.setFrameShape(QtWidgets.QFrame.VLine)
@@ -54,27 +55,26 @@ def build_ui(app) -> None:
     app.plotter.set_background("white")
     lay.addWidget(app.plotter.interactor, stretch=4)
 
-    try:
-        app.plotter.ren_win.SetMultiSamples(8)
-        app.plotter_ref.ren_win.SetMultiSamples(8)
-    except Exception:
-        pass
-
-    app.left_title = QtWidgets.QLabel(app.plotter_ref.interactor)
-    app.left_title.setAutoFillBackground(True)
-    app.left_title.setStyleSheet(
-        "color:black; font-weight:bold; "
-        "background-color:white; font-size:14px;"
-    )
-    app.left_title.setText("Original Point Cloud")
-    app.left_title.hide()
-
-    app.right_title = QtWidgets.QLabel(app.plotter.interactor)
-    app.right_title.setAutoFillBackground(True)
-    app.right_title.setStyleSheet(
-        "color:black; font-weight:bold; "
-        "background-color:white; font-size:14px;"
-    )
-    app.right_title.setAlignment(QtCore.Qt.AlignCenter)
-    app.right_title.setText("Annotated Point Cloud")
-    app.right_title.show()
+    app.plotter.ren_win.SetMultiSamples(app.msaa_samples)
+
+    add_view_title(app.plotter, VIEW_TITLE_ANNOTATED)
+
+
+def ensure_ref_plotter(app) -> None:
+    """Build the Original (left) view the first time split mode needs it."""
+    if app.plotter_ref is not None:
+        return
+
+    app.plotter_ref = QtInteractor(app)
+    app.plotter_ref.set_background("white")
+    app.plotter_ref.setVisible(False)
+    app._central_layout.insertWidget(0, app.plotter_ref.interactor, stretch=4)
+
+    app.plotter_ref.ren_win.SetMultiSamples(app.msaa_samples)
+
+    add_view_title(app.plotter_ref, VIEW_TITLE_ORIGINAL)
+
+    app.plotter_ref.interactor.setMouseTracking(True)
+    app.plotter_ref.interactor.installEventFilter(app)
+
+    app._add_ref_actor(app.act_points_spheres.isChecked())
@@ -1,8 +1,29 @@
 from __future__ import annotations
 
+import functools
+
 from PyQt5 import QtCore, QtWidgets
 from PyQt5.QtGui import QColor, QIcon, QKeySequence, QPixmap
 
+from ui.icons import icon_color_pick
+
+_SWATCHES = (
+    ("Red", "#FF0000"), ("Green", "#00FF00"), ("Blue", "#0000FF"),
+    ("Yellow", "#FFFF00"), ("Cyan", "#00FFFF"), ("Magenta", "#FF00FF"),
+    ("Orange", "#FFA500"), ("Pink", "#FFC0CB"), ("Purple", "#800080"),
+    ("Brown", "#A52A2A"), ("Maroon", "#800000"), ("Olive", "#808000"),
+    ("Teal", "#008080"), ("Navy", "#000080"), ("Gray", "#808080"),
+    ("Light Gray", "#D3D3D3"), ("Black", "#000000"), ("White", "#FFFFFF"),
+)
+
+
+@functools.lru_cache(maxsize=64)
+def _swatch_icon(hexcol: str) -> QIcon:
+    # Built on first use (QPixmap needs a QApplication), then reused.
+    pix = QPixmap(14, 14)
+    pix.fill(QColor(hexcol))
+    return QIcon(pix)
+
 
 def build_menubar(app) -> None:
     menubar = app.menuBar()
@@ -11,40 +32,39 @@ def build_menubar(app) -> None:
 
     app.act_open_orig = QtWidgets.QAction("Open Original Folder", app)
     app.act_open_orig.triggered.connect(app.open_orig_folder)
-    file_menu.addAction(app.act_open_orig)
 
     app.act_open_ann = QtWidgets.QAction("Open Annotation Folder", app)
     app.act_open_ann.triggered.connect(app.open_ann_folder)
-    file_menu.addAction(app.act_open_ann)
 
     app.act_refresh_folders = QtWidgets.QAction("Refresh Folders", app)
     app.act_refresh_folders.triggered.connect(app.refresh_folders)
-    file_menu.addAction(app.act_refresh_folders)
 
     app.act_select_move_folder = QtWidgets.QAction("Select Revise / Move To Folder", app)
     app.act_select_move_folder.setShortcut(QKeySequence("Shift+M"))
     app.act_select_move_folder.setShortcutContext(QtCore.Qt.ApplicationShortcut)
     app.act_select_move_folder.triggered.connect(app.select_revise_move_folder)
-    file_menu.addAction(app.act_select_move_folder)
 
     app.act_move_to_folder = QtWidgets.QAction("Revise / Move To Folder", app)
     app.act_move_to_folder.setShortcut(QKeySequence("M"))
     app.act_move_to_folder.setShortcutContext(QtCore.Qt.ApplicationShortcut)
     # app.act_move_to_folder.setIcon(app._icon_revision())
     app.act_move_to_folder.triggered.connect(app.move_current_to_folder)
-    file_menu.addAction(app.act_move_to_folder)
+    file_menu.addActions([
+        app.act_open_orig, app.act_open_ann, app.act_refresh_folders,
+        app.act_select_move_folder, app.act_move_to_folder,
+    ])
 
     file_menu.addSeparator()
 
     app.act_save = QtWidgets.QAction("Save", app)
     app.act_save.setShortcut(QKeySequence.Save)
+    app.act_save.setShortcutContext(QtCore.Qt.ApplicationShortcut)
     app.act_save.triggered.connect(app.on_save)
-    file_menu.addAction(app.act_save)
 
     app.act_autosave.setText("Autosave")
     app.act_autosave.setCheckable(True)
     app.act_autosave.setChecked(True)
-    file_menu.addAction(app.act_autosave)
+    file_menu.addActions([app.act_save, app.act_autosave])
 
     file_menu.addSeparator()
 
@@ -63,13 +83,14 @@ def build_menubar(app) -> None:
 
     app.act_undo = QtWidgets.QAction("Undo", app)
     app.act_undo.setShortcut(QKeySequence.Undo)
+    app.act_undo.setShortcutContext(QtCore.Qt.ApplicationShortcut)
     app.act_undo.triggered.connect(app.on_undo)
-    edit_menu.addAction(app.act_undo)
 
     app.act_redo = QtWidgets.QAction("Redo", app)
     app.act_redo.setShortcut(QKeySequence.Redo)
+    app.act_redo.setShortcutContext(QtCore.Qt.ApplicationShortcut)
     app.act_redo.triggered.connect(app.on_redo)
-    edit_menu.addAction(app.act_redo)
+    edit_menu.addActions([app.act_undo, app.act_redo])
 
     edit_menu.addSeparator()
 
@@ -77,47 +98,43 @@ def build_menubar(app) -> None:
     app.act_eraser.setShortcut(QKeySequence("E"))
     app.act_eraser.setShortcutContext(QtCore.Qt.ApplicationShortcut)
     app.act_eraser.toggled.connect(app._on_eraser_toggled)
-    edit_menu.addAction(app.act_eraser)
 
     app.act_repair.setText("Repair Mode")
     app.act_repair.setShortcut(QKeySequence("Shift+R"))
+    app.act_repair.setShortcutContext(QtCore.Qt.ApplicationShortcut)
     app.act_repair.toggled.connect(lambda on: on and app.act_clone.setChecked(False))
     app.act_repair.toggled.connect(app.toggle_repair_mode)
-    edit_menu.addAction(app.act_repair)
 
     app.act_clone.setText("Clone Mode")
     app.act_clone.setShortcut(QKeySequence("C"))
+    app.act_clone.setShortcutContext(QtCore.Qt.ApplicationShortcut)
     app.act_clone.toggled.connect(lambda on: on and app.act_repair.setChecked(False))
     app.act_clone.toggled.connect(app.toggle_clone_mode)
-    edit_menu.addAction(app.act_clone)
+    edit_menu.addActions([app.act_eraser, app.act_repair, app.act_clone])
 
     edit_menu.addSeparator()
 
     color_menu = edit_menu.addMenu("Color")
 
     app.act_pick_color = QtWidgets.QAction("Pick Color", app)
-    pick_icon = QIcon(QPixmap("icons/color-pick.png").scaled(14, 14, QtCore.Qt.KeepAspectRatio, QtCore.Qt.SmoothTransformation))
-    app.act_pick_color.setIcon(pick_icon)
+    pick_icon = icon_color_pick(app)
+    if pick_icon is not None:
+        app.act_pick_color.setIcon(pick_icon)
     app.act_pick_color.triggered.connect(app.pick_color)
     color_menu.addAction(app.act_pick_color)
 
     color_menu.addSeparator()
 
-    app._SWATCHES = [
-        ("Red", "#FF0000"), ("Green", "#00FF00"), ("Blue", "#0000FF"),
-        ("Yellow", "#FFFF00"), ("Cyan", "#00FFFF"), ("Magenta", "#FF00FF"),
-        ("Orange", "#FFA500"), ("Pink", "#FFC0CB"), ("Purple", "#800080"),
-        ("Brown", "#A52A2A"), ("Maroon", "#800000"), ("Olive", "#808000"),
-        ("Teal", "#008080"), ("Navy", "#000080"), ("Gray", "#808080"),
-        ("Light Gray", "#D3D3D3"), ("Black", "#000000"), ("White", "#FFFFFF"),
-    ]
-    for name, hexcol in app._SWATCHES:
-        act = QtWidgets.QAction(name, app)
-        pix = QPixmap(14, 14)
-        pix.fill(QColor(hexcol))
-        act.setIcon(QIcon(pix))
-        act.triggered.connect(lambda _, c=hexcol: app.select_swatch(c, None))
-        color_menu.addAction(act)
+    # One group, one slot: each action carries its color in data().
+    swatch_group = QtWidgets.QActionGroup(app)
+    swatch_group.setExclusive(False)
+    swatch_acts = []
+    for name, hexcol in _SWATCHES:
+        act = QtWidgets.QAction(_swatch_icon(hexcol), name, swatch_group)
+        act.setData(hexcol)
+        swatch_acts.append(act)
+    color_menu.addActions(swatch_acts)
+    swatch_group.triggered.connect(lambda a: app.select_swatch(a.data(), None))
 
     view_menu = menubar.addMenu("&View")
 
@@ -133,41 +150,45 @@ def build_menubar(app) -> None:
         ("NW Isometric", 8, "Ctrl+I"),
         ("NE Isometric", 9, "Ctrl+O"),
     ]
+    view_acts = []
     for name, idx, shortcut in view_actions:
         act = QtWidgets.QAction(name, app)
         act.setShortcut(QKeySequence(shortcut))
         act.setShortcutContext(QtCore.Qt.ApplicationShortcut)
         act.triggered.connect(lambda _, i=idx: app._set_view(i))
-        view_menu.addAction(act)
+        view_acts.append(act)
+    view_menu.addActions(view_acts)
 
     view_menu.addSeparator()
 
     app.act_zoom_in = QtWidgets.QAction("Zoom In", app)
     app.act_zoom_in.setShortcuts([QKeySequence("Ctrl+="), QKeySequence("Ctrl++")])
+    app.act_zoom_in.setShortcutContext(QtCore.Qt.ApplicationShortcut)
     app.act_zoom_in.triggered.connect(app.on_zoom_in)
-    view_menu.addAction(app.act_zoom_in)
 
     app.act_zoom_out = QtWidgets.QAction("Zoom Out", app)
     app.act_zoom_out.setShortcut(QKeySequence.ZoomOut)
+    app.act_zoom_out.setShortcutContext(QtCore.Qt.ApplicationShortcut)
     app.act_zoom_out.triggered.connect(app.on_zoom_out)
-    view_menu.addAction(app.act_zoom_out)
 
     app.act_reset_view = QtWidgets.QAction("Reset View", app)
     app.act_reset_view.setShortcut("R")
+    app.act_reset_view.setShortcutContext(QtCore.Qt.ApplicationShortcut)
     app.act_reset_view.triggered.connect(app.reset_view)
-    view_menu.addAction(app.act_reset_view)
+    view_menu.addActions([app.act_zoom_in, app.act_zoom_out, app.act_reset_view])
 
     view_menu.addSeparator()
 
     app.act_annotation_mode.setText("Annotation Mode")
     app.act_annotation_mode.setShortcut(QKeySequence("Ctrl+A"))
+    app.act_annotation_mode.setShortcutContext(QtCore.Qt.ApplicationShortcut)
     app.act_annotation_mode.toggled.connect(app.toggle_annotation)
-    view_menu.addAction(app.act_annotation_mode)
 
     app.act_toggle_annotations.setText("Show Annotations")
     app.act_toggle_annotations.setShortcut(QKeySequence("Shift+A"))
+    app.act_toggle_annotations.setShortcutContext(QtCore.Qt.ApplicationShortcut)
     app.act_toggle_annotations.toggled.connect(app.set_annotations_visible)
-    view_menu.addAction(app.act_toggle_annotations)
+    view_menu.addActions([app.act_annotation_mode, app.act_toggle_annotations])
 
     view_menu.addSeparator()
 
@@ -182,6 +203,7 @@ def build_menubar(app) -> None:
     act_toggle_nav = QtWidgets.QAction("Toggle Navigation Pane", app, checkable=True)
     act_toggle_nav.setChecked(True)
     act_toggle_nav.setShortcut(QKeySequence("N"))
+    act_toggle_nav.setShortcutContext(QtCore.Qt.ApplicationShortcut)
     act_toggle_nav.toggled.connect(app.nav_dock.setVisible)
     app.act_toggle_nav = act_toggle_nav
     app.nav_dock.visibilityChanged.connect(app._on_nav_visibility_changed)
@@ -191,6 +213,7 @@ def build_menubar(app) -> None:
 
     app.act_loop.setText("Loop")
     app.act_loop.setShortcut(QKeySequence("L"))
+    app.act_loop.setShortcutContext(QtCore.Qt.ApplicationShortcut)
     app.act_loop.toggled.connect(app._toggle_loop)
     playback_menu.addAction(app.act_loop)
 
@@ -198,23 +221,23 @@ def build_menubar(app) -> None:
 
     app.act_prev = QtWidgets.QAction("Previous", app)
     app.act_prev.setShortcut(QKeySequence(QtCore.Qt.Key_Left))
+    app.act_prev.setShortcutContext(QtCore.Qt.ApplicationShortcut)
     app.act_prev.triggered.connect(app.on_prev)
-    playback_menu.addAction(app.act_prev)
 
     app.act_next = QtWidgets.QAction("Next", app)
     app.act_next.setShortcut(QKeySequence(QtCore.Qt.Key_Right))
+    app.act_next.setShortcutContext(QtCore.Qt.ApplicationShortcut)
     app.act_next.triggered.connect(app.on_next)
-    playback_menu.addAction(app.act_next)
+    playback_menu.addActions([app.act_prev, app.act_next])
 
     tools_menu = menubar.addMenu("&Tools")
 
     app.act_auto_contrast = QtWidgets.QAction("Auto Contrast", app)
     app.act_auto_contrast.triggered.connect(app.apply_auto_contrast)
-    tools_menu.addAction(app.act_auto_contrast)
 
     app.act_reset_contrast = QtWidgets.QAction("Reset Contrast", app)
     app.act_reset_contrast.triggered.connect(app.reset_contrast)
-    tools_menu.addAction(app.act_reset_contrast)
+    tools_menu.addActions([app.act_auto_contrast, app.act_reset_contrast])
 
     tools_menu.addSeparator()
 
@@ -1,22 +1,30 @@
 from __future__ import annotations
 
+import functools
+from collections import OrderedDict
+
+import numpy as np
 from PyQt5 import QtCore, QtWidgets, QtGui
 
 
+_VISITED_BRUSH = QtGui.QBrush(QtGui.QColor("#d0e7ff"))
+# Fast-mode row suffix, indexed by the shown flag bits >> 1 (dirty | annotated << 1).
+_FLAG_SUFFIX = ("", " [M]", " [A]", " [M A]")
+_DECORATION_ROLES = (QtCore.Qt.DisplayRole, QtCore.Qt.BackgroundRole)
+
+
 def build_nav_dock(app) -> None:
     """Patch 2B: Left navigation dock (empty shell)."""
     app.nav_dock = QtWidgets.QDockWidget("Navigation", app)
     app.nav_dock.setMinimumWidth(110)
     app.nav_dock.setMaximumWidth(400)
 
-    app.addDockWidget(QtCore.Qt.LeftDockWidgetArea, app.nav_dock)
-
     app.nav_dock.setObjectName("NavigationDock")
     app.nav_dock.setAllowedAreas(
         QtCore.Qt.LeftDockWidgetArea | QtCore.Qt.RightDockWidgetArea
     )
     app.nav_dock.setFeatures(QtWidgets.QDockWidget.NoDockWidgetFeatures)
-    app.nav_dock.setTitleBarWidget(QtWidgets.QWidget())
+    app.nav_dock.setTitleBarWidget(QtWidgets.QWidget(app.nav_dock))
 
     container = QtWidgets.QWidget(app.nav_dock)
     layout = QtWidgets.QVBoxLayout(container)
@@ -35,19 +43,32 @@ def build_nav_dock(app) -> None:
     app.nav_status.setMaximumHeight(4)
     layout.addWidget(app.nav_status)
 
-    app.nav_list = QtWidgets.QListWidget()
+    app.nav_model = NavModel(app)
+    app.nav_list = QtWidgets.QListView()
+    app.nav_list.setModel(app.nav_model)
     app.nav_list.setSelectionMode(QtWidgets.QAbstractItemView.SingleSelection)
     app.nav_list.setUniformItemSizes(True)
+    # Lay rows out in chunks across event-loop turns so large folders
+    # don't block the UI on the first pass.
+    app.nav_list.setViewMode(QtWidgets.QListView.ListMode)
+    app.nav_list.setResizeMode(QtWidgets.QListView.Adjust)
+    app.nav_list.setLayoutMode(QtWidgets.QListView.Batched)
+    app.nav_list.setBatchSize(64)
     app.nav_list.setAlternatingRowColors(True)
-    app.nav_list.currentRowChanged.connect(app._on_nav_row_changed)
+    app.nav_list.selectionModel().currentRowChanged.connect(
+        lambda cur, _prev: app._on_nav_row_changed(cur.row())
+    )
 
     app.nav_list.setSpacing(4)
     app.nav_list.setStyleSheet("""
-    QListWidget::item {
+    QListView::item {
         padding: 4px;
     }
     """)
 
+    app._nav_default_delegate = app.nav_list.itemDelegate()
+    app._nav_delegate = NavItemDelegate(app, app.nav_list)
+
     layout.addWidget(app.nav_list, 1)
 
     layout.addStretch(0)
@@ -58,114 +79,244 @@ def build_nav_dock(app) -> None:
     app.nav_dock.setVisible(True)
 
 
+@functools.lru_cache(maxsize=8192)
+def _truncate_name(name: str, max_len: int) -> str:
+    return name if len(name) <= max_len else name[:max_len - 1] + "."
+
+
 def nav_display_name(app, name: str) -> str:
-    if len(name) <= app.NAV_NAME_MAX:
-        return name
-    return name[:app.NAV_NAME_MAX - 1] + "."
+    # Hit on every delegate repaint; cached so scrolling is a dict probe.
+    return _truncate_name(name, app.NAV_NAME_MAX)
 
 
-def make_nav_item_widget(app, idx: int):
+class NavModel(QtCore.QAbstractListModel):
     """
-    Thumbnail on top, index + filename below,
-    with overlay state indicators (dirty / annotated).
+    Rows are app.files; text, tint and flags are derived on demand from the
+    per-file arrays, and thumbnails are loaded only for rows the view asks
+    to paint (kept in a small LRU).
     """
-    w = QtWidgets.QWidget()
-    w.setAttribute(QtCore.Qt.WA_StyledBackground, True)
-
-    lay = QtWidgets.QVBoxLayout(w)
-    lay.setContentsMargins(4, 4, 4, 4)
-    lay.setSpacing(4)
-    lay.setAlignment(QtCore.Qt.AlignCenter)
-
-    thumb_container = QtWidgets.QFrame()
-    thumb_container.setFixedSize(app.NAV_THUMB_SIZE, app.NAV_THUMB_SIZE)
-    thumb_container.setStyleSheet("background: transparent;")
-    thumb_container.setAttribute(QtCore.Qt.WA_StyledBackground, True)
-
-    thumb_layout = QtWidgets.QStackedLayout(thumb_container)
-    thumb_layout.setContentsMargins(0, 0, 0, 0)
-
-    lbl_img = QtWidgets.QLabel()
-    lbl_img.setAlignment(QtCore.Qt.AlignCenter)
-
-    icon = app.thumbs.thumb_icon_for_index(idx)
-    if icon is not None:
-        lbl_img.setPixmap(icon.pixmap(app.NAV_THUMB_SIZE, app.NAV_THUMB_SIZE))
-
-    thumb_layout.addWidget(lbl_img)
-
-    dot_dirty = QtWidgets.QLabel(thumb_container)
-    dot_dirty.setFixedSize(10, 10)
-    dot_dirty.setStyleSheet("background:red; border-radius:5px;")
-    dot_dirty.move(app.NAV_THUMB_SIZE - 10, 2)
-    dot_dirty.hide()
-
-    dot_annot = QtWidgets.QLabel(thumb_container)
-    dot_annot.setFixedSize(10, 10)
-    dot_annot.setStyleSheet("background:green; border-radius:5px;")
-    dot_annot.move(app.NAV_THUMB_SIZE - 10, app.NAV_THUMB_SIZE - 10)
-    dot_annot.hide()
-
-    name = app.files[idx].name
-    txt = f"{idx+1:04d}\n{nav_display_name(app, name)}"
-
-    lbl_txt = QtWidgets.QLabel(txt)
-    lbl_txt.setAlignment(QtCore.Qt.AlignCenter)
-    lbl_txt.setWordWrap(True)
-    lbl_txt.setStyleSheet("font-size:11px;")
-
-    lay.addWidget(thumb_container)
-    lay.addWidget(lbl_txt)
-
-    app._nav_item_widgets[idx] = {
-        "root": w,
-        "img": lbl_img,
-        "dirty": dot_dirty,
-        "annotated": dot_annot,
-    }
 
-    decorate_nav_item(app, idx)
+    PIXMAP_CACHE_MAX = 512
+
+    def __init__(self, app, parent=None):
+        super().__init__(parent)
+        self.app = app
+        self.fast = False
+        self.size_hint = QtCore.QSize()
+        self._n = 0                     # row count, fixed between resets
+        self._pixmaps = OrderedDict()   # row -> QPixmap
+        self._missing = set()           # rows whose thumbnail is not on disk yet
+        self._decorated = OrderedDict() # row -> ((dirty, annotated), base, QPixmap)
+
+    def reset(self, fast: bool) -> None:
+        self.beginResetModel()
+        self._n = len(self.app.files)
+        self.fast = fast
+        extra = 24 if fast else 48
+        self.size_hint = QtCore.QSize(self.app.NAV_THUMB_SIZE + 16, self.app.NAV_THUMB_SIZE + extra)
+        self._pixmaps.clear()
+        self._missing.clear()
+        self._decorated.clear()
+        self.endResetModel()
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else self._n
+
+    def _pixmap(self, row: int):
+        pix = self._pixmaps.get(row)
+        if pix is not None:
+            self._pixmaps.move_to_end(row)
+            return pix
+        if row in self._missing:
+            return None
+        pix = self.app.thumbs.thumb_pixmap_for_index(row, self.app.NAV_THUMB_SIZE)
+        if pix is None:
+            self._missing.add(row)
+            return None
+        self._pixmaps[row] = pix
+        if len(self._pixmaps) > self.PIXMAP_CACHE_MAX:
+            self._pixmaps.popitem(last=False)
+        return pix
+
+    def decorated_pixmap(self, row: int, dirty: bool, annotated: bool):
+        """
+        Thumbnail with the dirty / annotated dots baked in, rebuilt only when
+        the flags or the base thumbnail change. Plain rows get the thumbnail.
+        """
+        base = self._pixmap(row)
+        if not (dirty or annotated):
+            return base
+        flags = (dirty, annotated)
+        cached = self._decorated.get(row)
+        if cached is not None and cached[0] == flags and cached[1] is base:
+            self._decorated.move_to_end(row)
+            return cached[2]
+
+        size = self.app.NAV_THUMB_SIZE
+        out = QtGui.QPixmap(size, size)
+        out.fill(QtCore.Qt.transparent)
+        p = QtGui.QPainter(out)
+        if base is not None:
+            p.drawPixmap((size - base.width()) // 2, (size - base.height()) // 2, base)
+        p.setRenderHint(QtGui.QPainter.Antialiasing, True)
+        p.setPen(QtCore.Qt.NoPen)
+        if dirty:
+            p.setBrush(QtCore.Qt.red)
+            p.drawEllipse(QtCore.QRectF(size - 10, 2, 10, 10))
+        if annotated:
+            p.setBrush(QtCore.Qt.green)
+            p.drawEllipse(QtCore.QRectF(size - 10, size - 10, 10, 10))
+        p.end()
+
+        self._decorated[row] = (flags, base, out)
+        if len(self._decorated) > self.PIXMAP_CACHE_MAX:
+            self._decorated.popitem(last=False)
+        return out
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        row = index.row()
+        app = self.app
+        if not index.isValid() or row >= len(app.files):
+            return None
+        if role == QtCore.Qt.DecorationRole:
+            return self._pixmap(row)
+        if role == QtCore.Qt.SizeHintRole:
+            return self.size_hint
+        if role == QtCore.Qt.UserRole:
+            return row
+        if not self.fast:
+            return None   # NavItemDelegate paints everything else itself
+        if role == QtCore.Qt.DisplayRole:
+            shown = app._nav_flags_shown
+            bits = int(shown[row]) >> 1 if row < len(shown) else 0
+            return app._nav_row_text(row) + _FLAG_SUFFIX[bits]
+        if role == QtCore.Qt.BackgroundRole:
+            shown = app._nav_flags_shown
+            return _VISITED_BRUSH if row < len(shown) and shown[row] & 1 else None
+        if role == QtCore.Qt.ToolTipRole:
+            return app.files[row].name
+        return None
+
+    def row_changed(self, row: int, roles=()) -> None:
+        self.rows_changed(row, row, roles)
+
+    def rows_changed(self, first: int, last: int, roles=()) -> None:
+        self.dataChanged.emit(self.index(first), self.index(last), list(roles))
+
+    def thumbnail_ready(self, row: int) -> None:
+        self._missing.discard(row)
+        self._pixmaps.pop(row, None)
+        self._decorated.pop(row, None)
+        self.row_changed(row, (QtCore.Qt.DecorationRole,))
+
+    def clear_thumbnails(self) -> None:
+        self._pixmaps.clear()
+        self._missing.clear()
+        self._decorated.clear()
+        n = self.rowCount()
+        if n:
+            self.dataChanged.emit(self.index(0), self.index(n - 1), [QtCore.Qt.DecorationRole])
+
+
+class NavItemDelegate(QtWidgets.QStyledItemDelegate):
+    """
+    Paints a nav row: thumbnail (dirty / annotated dots baked in by the
+    model) on top, index + filename below. Replaces a widget per row.
+    """
 
-    return w
+    def __init__(self, app, parent=None):
+        super().__init__(parent)
+        self.app = app
+        self.font = QtGui.QFont()
+        self.font.setPixelSize(11)
 
+    def sizeHint(self, option, index):
+        return QtCore.QSize(self.app.NAV_THUMB_SIZE + 16, self.app.NAV_THUMB_SIZE + 48)
 
-def decorate_nav_item(app, idx: int) -> None:
-    if getattr(app, "_nav_fast_mode", False):
-        if not hasattr(app, "nav_list"):
-            return
-        item = app.nav_list.item(idx)
-        if item is None:
+    def paint(self, painter, option, index):
+        app = self.app
+        idx = index.row()
+        if idx >= len(app.files):
             return
 
-        if idx in app._visited:
-            item.setBackground(QtGui.QColor("#d0e7ff"))
-        else:
-            item.setBackground(QtGui.QBrush())
-
-        flags = []
-        if idx in app._dirty:
-            flags.append("M")
-        if idx in app._annotated:
-            flags.append("A")
-        suffix = f" [{' '.join(flags)}]" if flags else ""
-        item.setText(app._nav_row_text(idx) + suffix)
-        return
+        opt = QtWidgets.QStyleOptionViewItem(option)
+        self.initStyleOption(opt, index)
+        opt.text = ""
+        opt.icon = QtGui.QIcon()
+        style = opt.widget.style() if opt.widget is not None else QtWidgets.QApplication.style()
+        style.drawPrimitive(QtWidgets.QStyle.PE_PanelItemViewItem, opt, painter, opt.widget)
+
+        painter.save()
+        rect = option.rect
+        if app._visited[idx] and not option.state & QtWidgets.QStyle.State_Selected:
+            painter.fillRect(rect, _VISITED_BRUSH)
+
+        size = app.NAV_THUMB_SIZE
+        thumb = QtCore.QRect(rect.x() + (rect.width() - size) // 2, rect.y() + 4, size, size)
+
+        pix = app.nav_model.decorated_pixmap(idx, bool(app._dirty[idx]), bool(app._annotated[idx]))
+        if pix is not None and not pix.isNull():
+            painter.drawPixmap(
+                thumb.x() + (size - pix.width()) // 2,
+                thumb.y() + (size - pix.height()) // 2,
+                pix,
+            )
+
+        painter.setFont(self.font)
+        painter.setPen(opt.palette.color(
+            QtGui.QPalette.HighlightedText
+            if option.state & QtWidgets.QStyle.State_Selected
+            else QtGui.QPalette.Text
+        ))
+        text_rect = QtCore.QRect(rect.x() + 4, thumb.bottom() + 5, rect.width() - 8, rect.bottom() - thumb.bottom() - 8)
+        name = app.files[idx].name
+        painter.drawText(
+            text_rect,
+            QtCore.Qt.AlignHCenter | QtCore.Qt.AlignTop | QtCore.Qt.TextWordWrap,
+            f"{idx+1:04d}\n{nav_display_name(app, name)}",
+        )
+        painter.restore()
 
-    if not hasattr(app, "_nav_item_widgets"):
-        return
 
-    entry = app._nav_item_widgets.get(idx)
-    if entry is None:
-        return
+def decorate_nav_item(app, idx: int) -> None:
+    """
+    Queue a row for re-decoration. Rows flipped within one event (save,
+    undo, autosave passes) are applied together by flush_nav_decorations.
+    """
+    app._nav_dirty_idx.add(idx)
+    if not app._nav_flush_timer.isActive():
+        app._nav_flush_timer.start(0)
+
 
-    root = entry["root"]
-    dot_dirty = entry["dirty"]
-    dot_annot = entry["annotated"]
+def flush_nav_decorations(app) -> None:
+    if not app._nav_dirty_idx:
+        return
+    idxs = np.fromiter(app._nav_dirty_idx, dtype=np.intp, count=len(app._nav_dirty_idx))
+    app._nav_dirty_idx.clear()
+    decorate_nav_items(app, idxs)
 
-    if idx in app._visited:
-        root.setStyleSheet("background:#d0e7ff;")
-    else:
-        root.setStyleSheet("")
 
-    dot_dirty.setVisible(idx in app._dirty)
-    dot_annot.setVisible(idx in app._annotated)
+def decorate_nav_items(app, idxs) -> None:
+    """
+    decorate_nav_item for many rows: diff all their flag bits at once and
+    repaint the changed span with a single dataChanged.
+    """
+    if not hasattr(app, "nav_model"):
+        return
+    shown = app._nav_flags_shown
+    idxs = np.asarray(idxs, dtype=np.intp)
+    idxs = idxs[idxs < len(shown)]
+    if idxs.size == 0:
+        return
+    # bit0 = visited, bit1 = dirty, bit2 = annotated
+    bits = (
+        app._visited[idxs].astype(np.uint8)
+        | app._dirty[idxs].astype(np.uint8) << 1
+        | app._annotated[idxs].astype(np.uint8) << 2
+    )
+    changed = idxs[bits != shown[idxs]]
+    if changed.size == 0:
+        return
+    shown[idxs] = bits
+    # The model/delegate read the flags at paint time; just repaint the rows.
+    app.nav_model.rows_changed(int(changed.min()), int(changed.max()), _DECORATION_ROLES)
@@ -1,21 +1,18 @@
 from __future__ import annotations
 
+VIEW_TITLE_ANNOTATED = "Annotated Point Cloud"
+VIEW_TITLE_ORIGINAL = "Original Point Cloud"
 
-def position_overlays(app) -> None:
-    # RIGHT (annotated) overlays
-    if hasattr(app, "right_title") and hasattr(app, "plotter"):
-        h1 = app.plotter.interactor.height()
-        w1 = app.plotter.interactor.width()
-        app.right_title.adjustSize()
-        app.right_title.move((w1 - app.right_title.width()) // 2,
-                             h1 - app.right_title.height() - 2)
-        app.right_title.raise_()
 
-    # LEFT (original) label
-    if hasattr(app, "left_title") and hasattr(app, "plotter_ref") and app.plotter_ref.isVisible():
-        h2 = app.plotter_ref.interactor.height()
-        w2 = app.plotter_ref.interactor.width()
-        app.left_title.adjustSize()
-        app.left_title.move((w2 - app.left_title.width()) // 2,
-                            h2 - app.left_title.height() - 2)
-        app.left_title.raise_()
+def add_view_title(plotter, text: str):
+    """
+    Title along the bottom edge of a view, drawn by VTK inside the render
+    window (so it follows resizes without a Qt overlay). Re-add after
+    plotter.clear(), which removes it with the other actors.
+    """
+    actor = plotter.add_text(text, position="lower_edge", font_size=11, color="black", name="view_title")
+    prop = actor.GetTextProperty()
+    prop.SetBold(True)
+    prop.SetBackgroundColor(1.0, 1.0, 1.0)
+    prop.SetBackgroundOpacity(1.0)
+    return actor
@@ -1,35 +1,133 @@
 from __future__ import annotations
 
-from pathlib import Path
-
 from PyQt5 import QtCore, QtWidgets, QtGui
-from PyQt5.QtGui import QIcon
 from PyQt5.QtWidgets import QToolButton
 
+from ui.icons import icon_color_pick, icon_standard
+
+_DELAY_PRESETS = (0.1, 0.5, 1.0, 2.0, 5.0, 10.0)   # seconds, loop delay menu
+_SLIDER_THROTTLE_MS = 33   # max one re-render per frame while dragging
+
+_SWATCH_EDGE = QtGui.QColor("#777")
+_SWATCH_EDGE_ON = QtGui.QColor("#00E5FF")
+
+_SWATCH_COLS = 6
+_SWATCH_COLORS = (
+    "#FF0000", "#00FF00", "#0000FF", "#FFFF00",
+    "#00FFFF", "#FF00FF", "#FFA500", "#800080",
+    "#A52A2A", "#808080", "#000000", "#FFFFFF",
+    "#008080", "#000080", "#808000", "#FFC0CB",
+    "#C0C0C0", "#FFD700", "#4B0082", "#2E8B57",
+    "#DC143C", "#4682B4", "#9ACD32", "#8B4513",
+    "#7FFF00", "#00CED1", "#FF1493", "#708090",
+    "#FFDAB9",
+)
+
+# One sheet for the whole ribbon, installed once in build_ribbon. Widgets
+# opt into variants via objectName instead of carrying their own sheet.
+_RIBBON_QSS = """
+* {
+    background: #efefef;
+}
+RibbonGroup, RibbonGroup QFrame {
+    background: #f4f4f4;
+    border: 1px solid #cfcfcf;
+    border-radius: 4px;
+}
+RibbonGroup QLabel {
+    color: #222;
+}
+QLabel#ribbonRowLabel {
+    font-size: 11px;
+    color: #222;
+    background: transparent;
+    border: none;
+    padding: 0px;
+}
+QLabel#ribbonValueLabel {
+    font-size: 11px;
+    color: #222;
+}
+QLabel#ribbonGroupTitle {
+    font-size: 10px;
+    color: #555;
+    padding: 0px;
+    background: transparent;
+    border: none;
+}
+QToolButton#ribbonBtn {
+    padding: 1px;
+}
+QToolButton#ribbonBtn:checked {
+    background: #d0e7ff;
+    border: 1px solid #7aa7d9;
+    border-radius: 3px;
+}
+QToolButton#swatchPick {
+    border: 1px solid transparent;
+    border-radius: 2px;
+}
+QToolButton#swatchPick:hover {
+    border-color: #777;
+}
+QToolButton#swatchPick:pressed {
+    border-color: #00E5FF;
+}
+QSlider#ribbonSlider::groove:horizontal {
+    background: #d0d0d0;
+    height: 4px;
+    border-radius: 2px;
+}
+QSlider#ribbonSlider::sub-page:horizontal {
+    background: #8a8a8a;
+    height: 4px;
+    border-radius: 2px;
+}
+QSlider#ribbonSlider::add-page:horizontal {
+    background: #d0d0d0;
+    height: 4px;
+    border-radius: 2px;
+}
+QSlider#ribbonSlider::handle:horizontal {
+    background: #000000;
+    border: 1px solid #000000;
+    width: 10px;
+    height: 10px;
+    margin: -4px 0;
+    border-radius: 5px;
+}
+"""
+
+_DELAY_MENU_QSS = """
+QMenu {
+    background-color: #f4f4f4;
+    color: #222;
+}
+QMenu::item {
+    background-color: transparent;
+    color: #222;
+    padding: 4px 20px 4px 20px;
+}
+QMenu::item:selected {
+    background-color: #d0e7ff;
+    color: #222;
+}
+"""
+
 
 class RibbonGroup(QtWidgets.QFrame):
     """
     Compact ribbon group:
       - Controls are arranged in a grid (label left, control right)
       - Bottom title is plain text (no boxed footer)
-      - add(widget): full-row widget (buttons, checkboxes, etc.)
+      - add(widget, ...): full-row widget, or several packed left to right
       - add_row("Label", widget, trailing_widget=None): label+control row
     """
     def __init__(self, title: str, width=150, parent=None, title_position="bottom"):
         super().__init__(parent)
 
         self.setFixedWidth(width)
-        self.setFrameShape(QtWidgets.QFrame.StyledPanel)
-        self.setStyleSheet("""
-            QFrame {
-                background: #f4f4f4;
-                border: 1px solid #cfcfcf;
-                border-radius: 4px;
-            }
-            QLabel {
-                color: #222;
-            }
-        """)
+        self.setFrameShape(QtWidgets.QFrame.StyledPanel)   # styled by _RIBBON_QSS
 
         outer = QtWidgets.QVBoxLayout(self)
         outer.setContentsMargins(6, 4, 6, 4)
@@ -43,15 +141,7 @@ class RibbonGroup(QtWidgets.QFrame):
         self.grid.setColumnStretch(1, 1)
         self.title_lbl = QtWidgets.QLabel(title, self)
         self.title_lbl.setAlignment(QtCore.Qt.AlignHCenter | QtCore.Qt.AlignVCenter)
-        self.title_lbl.setStyleSheet("""
-            QLabel {
-                font-size: 10px;
-                color: #555;
-                padding: 0px;
-                background: transparent;
-                border: none;
-            }
-        """)
+        self.title_lbl.setObjectName("ribbonGroupTitle")
         if title_position == "top":
             outer.addWidget(self.title_lbl, 0)
             outer.addWidget(self.controls, 1)
@@ -61,41 +151,127 @@ class RibbonGroup(QtWidgets.QFrame):
 
         self._row = 0
 
-    def add(self, w):
-        """Full-width widget row."""
-        self.grid.addWidget(w, self._row, 0, 1, 3)
+    def add(self, *widgets, spacing=2):
+        """
+        Full-width row. Several widgets share the row through a bare
+        QHBoxLayout in the grid cell (no wrapper QWidget).
+        """
+        if len(widgets) == 1:
+            self.grid.addWidget(widgets[0], self._row, 0, 1, 3)
+        else:
+            row = QtWidgets.QHBoxLayout()
+            row.setContentsMargins(0, 0, 0, 0)
+            row.setSpacing(spacing)
+            for w in widgets:
+                row.addWidget(w)
+            self.grid.addLayout(row, self._row, 0, 1, 3)
         self._row += 1
 
     def add_row(self, label: str, w, trailing=None):
         """Label on left, control on right, optional trailing widget."""
-        lbl = QtWidgets.QLabel(label)
-        lbl.setStyleSheet(
-            "font-size: 11px; color: #222; background: transparent; border: none; padding: 0px;"
-        )
-        lbl.setAlignment(QtCore.Qt.AlignVCenter | QtCore.Qt.AlignLeft)
+        self.grid.addWidget(_small_label(label), self._row, 0)
 
-        self.grid.addWidget(lbl, self._row, 0)
-
-        try:
-            w.setSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Fixed)
-        except Exception:
-            pass
+        w.setSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Fixed)
 
         if trailing is None:
             self.grid.addWidget(w, self._row, 1, 1, 2)
         else:
             self.grid.addWidget(w, self._row, 1)
-
-        if trailing is not None:
-            try:
-                trailing.setSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Fixed)
-            except Exception:
-                pass
+            trailing.setSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Fixed)
             self.grid.addWidget(trailing, self._row, 2)
 
         self._row += 1
 
 
+def _small_label(text: str, parent=None) -> QtWidgets.QLabel:
+    """Left-aligned ribbon row label, styled by _RIBBON_QSS (#ribbonRowLabel)."""
+    lbl = QtWidgets.QLabel(text, parent)
+    lbl.setObjectName("ribbonRowLabel")
+    lbl.setAlignment(QtCore.Qt.AlignVCenter | QtCore.Qt.AlignLeft)
+    return lbl
+
+
+class SwatchGrid(QtWidgets.QWidget):
+    """
+    Colour swatches painted by one widget instead of a button per colour.
+    Clicking a cell selects it (exclusive) and emits swatchClicked(color);
+    the selected cell gets a thick cyan border, the hovered one a thin one.
+    cell_rect(len(colors)) is the free cell after the last swatch.
+    """
+    swatchClicked = QtCore.pyqtSignal(str)
+
+    CELL = 16
+    GAP = 3
+
+    def __init__(self, colors, cols, parent=None):
+        super().__init__(parent)
+        self._colors = tuple(colors)
+        self._fills = tuple(QtGui.QColor(c) for c in self._colors)
+        self._cols = cols
+        self._selected = -1
+        self._hover = -1
+        step = self.CELL + self.GAP
+        self._rects = tuple(self.cell_rect(i) for i in range(len(self._colors)))
+        rows = len(self._colors) // cols + 1
+        self.setFixedSize(cols * step - self.GAP, rows * step - self.GAP)
+        self.setMouseTracking(True)
+
+    def cell_rect(self, i: int) -> QtCore.QRect:
+        step = self.CELL + self.GAP
+        r, c = divmod(i, self._cols)
+        return QtCore.QRect(c * step, r * step, self.CELL, self.CELL)
+
+    def _hit(self, pos) -> int:
+        step = self.CELL + self.GAP
+        c, cx = divmod(pos.x(), step)
+        r, cy = divmod(pos.y(), step)
+        if cx >= self.CELL or cy >= self.CELL or c >= self._cols:
+            return -1
+        i = r * self._cols + c
+        return i if 0 <= i < len(self._colors) else -1
+
+    def _set_cell(self, attr: str, i: int) -> None:
+        old = getattr(self, attr)
+        if old == i:
+            return
+        setattr(self, attr, i)
+        for j in (old, i):
+            if j >= 0:
+                self.update(self._rects[j])
+
+    def mousePressEvent(self, event):
+        i = self._hit(event.pos()) if event.button() == QtCore.Qt.LeftButton else -1
+        if i < 0:
+            super().mousePressEvent(event)
+            return
+        self._set_cell("_selected", i)
+        self.swatchClicked.emit(self._colors[i])
+
+    def mouseMoveEvent(self, event):
+        self._set_cell("_hover", self._hit(event.pos()))
+        super().mouseMoveEvent(event)
+
+    def leaveEvent(self, event):
+        self._set_cell("_hover", -1)
+        super().leaveEvent(event)
+
+    def paintEvent(self, event):
+        p = QtGui.QPainter(self)
+        exposed = event.rect()
+        for i, (rect, fill) in enumerate(zip(self._rects, self._fills)):
+            if not exposed.intersects(rect):
+                continue
+            if i == self._selected:
+                edge, width = _SWATCH_EDGE_ON, 3
+            elif i == self._hover:
+                edge, width = _SWATCH_EDGE_ON, 1
+            else:
+                edge, width = _SWATCH_EDGE, 1
+            p.fillRect(rect, edge)
+            p.fillRect(rect.adjusted(width, width, -width, -width), fill)
+        p.end()
+
+
 def _ribbon_button(icon, tooltip, checkable=False, icon_size=14, button_size=22):
     btn = QToolButton()
     btn.setIcon(icon)
@@ -104,26 +280,82 @@ def _ribbon_button(icon, tooltip, checkable=False, icon_size=14, button_size=22)
     btn.setCheckable(checkable)
     btn.setAutoRaise(True)
     btn.setFixedSize(button_size, button_size)
-    btn.setStyleSheet("""
-        QToolButton { padding: 1px; }
-        QToolButton:checked {
-            background: #d0e7ff;
-            border: 1px solid #7aa7d9;
-            border-radius: 3px;
-        }
-    """)
+    btn.setObjectName("ribbonBtn")   # styled by _RIBBON_QSS
     return btn
 
 
+def _throttled(fn, parent, interval_ms=_SLIDER_THROTTLE_MS):
+    """
+    Rate-limit fn to one call per interval. The first call runs at once;
+    calls inside the window collapse into one trailing call with the
+    latest arguments, so the final slider value is always applied.
+    The returned callable's cancel() drops a pending trailing call.
+    """
+    timer = QtCore.QTimer(parent)
+    timer.setSingleShot(True)
+    timer.setInterval(interval_ms)
+    pending = []
+
+    def _flush():
+        if pending:
+            args = pending.pop()
+            fn(*args)
+            timer.start()
+
+    def _call(*args):
+        if timer.isActive():
+            pending[:] = [args]
+        else:
+            fn(*args)
+            timer.start()
+
+    def _cancel():
+        timer.stop()
+        pending.clear()
+
+    timer.timeout.connect(_flush)
+    _call.cancel = _cancel
+    return _call
+
+
+def _bind_action(btn, act) -> None:
+    """
+    Two-way checked sync between a ribbon button and its QAction. The
+    action -> button leg runs with the button's signals blocked, so a
+    change never bounces back through the other side.
+    """
+    btn.setChecked(act.isChecked())
+    btn.toggled.connect(act.setChecked)
+
+    def _from_action(on):
+        blocked = btn.blockSignals(True)
+        btn.setChecked(on)
+        btn.blockSignals(blocked)
+
+    act.toggled.connect(_from_action)
+
+
 def build_ribbon(app) -> QtWidgets.QWidget:
     ribbon = QtWidgets.QWidget(app)
     ribbon.setFixedHeight(130)
-    ribbon.setStyleSheet("background:#efefef;")
 
-    h = QtWidgets.QHBoxLayout(ribbon)
+    # Hold repaints while the groups are added and styled; one pass at the end.
+    ribbon.setUpdatesEnabled(False)
+    try:
+        _fill_ribbon(app, ribbon)
+        ribbon.setStyleSheet(_RIBBON_QSS)
+    finally:
+        ribbon.setUpdatesEnabled(True)
+    return ribbon
+
+
+def _fill_ribbon(app, ribbon) -> None:
+    # One grid row: every column is stretched to the row's height (the
+    # tallest group), and the spare height goes to the empty row below.
+    h = QtWidgets.QGridLayout(ribbon)
     h.setContentsMargins(6, 4, 6, 4)
-    h.setSpacing(6)
-    h.setAlignment(QtCore.Qt.AlignTop)
+    h.setHorizontalSpacing(6)
+    h.setVerticalSpacing(0)
 
     nav = RibbonGroup("Navigation", 130, title_position="top")
 
@@ -134,9 +366,7 @@ def build_ribbon(app) -> QtWidgets.QWidget:
     btn_next.clicked.connect(app.on_next)
 
     chk_loop = _ribbon_button(app._icon_loop(), "Loop playback", checkable=True)
-    chk_loop.setChecked(app.act_loop.isChecked())
-    chk_loop.toggled.connect(app.act_loop.setChecked)
-    app.act_loop.toggled.connect(chk_loop.setChecked)
+    _bind_action(chk_loop, app.act_loop)
     
     btn_revision = _ribbon_button(app._icon_revision(), "Revise / Move To Folder (M)")
     btn_revision.clicked.connect(app.move_current_to_folder)
@@ -149,170 +379,120 @@ def build_ribbon(app) -> QtWidgets.QWidget:
     delay_validator.setNotation(QtGui.QDoubleValidator.StandardNotation)
     delay.setValidator(delay_validator)
 
+    def _show_delay(val):
+        # Skip no-op writes, and only give focus back (so arrow-key
+        # shortcuts work again) when the field actually holds it.
+        text = f"{val:.2f}"
+        if delay.text() != text:
+            delay.setText(text)
+        if delay.hasFocus():
+            delay.clearFocus()
+
     def _commit_delay():
         text = delay.text().strip()
         try:
             val = float(text)
         except ValueError:
-            delay.setText(f"{app.loop_delay_sec:.2f}")
-            delay.clearFocus()
+            _show_delay(app.loop_delay_sec)
             return
         val = max(0.1, min(60.0, val))
         app._set_loop_delay(val)
-        delay.setText(f"{val:.2f}")
-        delay.clearFocus()
+        _show_delay(val)
 
     delay.editingFinished.connect(_commit_delay)
 
     btn_delay_menu = _ribbon_button(
-        app.style().standardIcon(QtWidgets.QStyle.SP_FileDialogDetailedView),
+        icon_standard(app, QtWidgets.QStyle.SP_FileDialogDetailedView),
         "Delay presets"
     )
     btn_delay_menu.setPopupMode(QToolButton.InstantPopup)
     btn_delay_menu.setFixedSize(24, 22)
 
+    # Only the empty menu exists up front; _fill_delay_menu styles and
+    # populates it the first time it is about to pop up.
     delay_menu = QtWidgets.QMenu(btn_delay_menu)
-    delay_menu.setStyleSheet("""
-        QMenu {
-            background-color: #f4f4f4;
-            color: #222;
-        }
-        QMenu::item {
-            background-color: transparent;
-            color: #222;
-            padding: 4px 20px 4px 20px;
-        }
-        QMenu::item:selected {
-            background-color: #d0e7ff;
-            color: #222;
-        }
-        """)
 
     def _set_delay(val):
         val = float(val)
         app._set_loop_delay(val)
-        delay.setText(f"{val:.2f}")
-        delay.clearFocus()
+        _show_delay(val)
 
-    for v in (0.1, 0.5, 1.0, 2.0, 5.0, 10.0):
-        act = QtWidgets.QAction(f"{v:.1f} s", app)
-        act.triggered.connect(lambda _, x=v: _set_delay(x))
-        delay_menu.addAction(act)
-
-    delay_menu.addSeparator()
+    custom_dlg = None
 
     def _custom_delay():
-        val, ok = QtWidgets.QInputDialog.getDouble(
-            app,
-            "Loop Delay",
-            "Seconds:",
-            app.loop_delay_sec,
-            0.1,
-            60.0,
-            1,
-        )
-        if ok:
-            _set_delay(val)
-
-    act_custom = QtWidgets.QAction("Custom.", app)
-    act_custom.triggered.connect(_custom_delay)
-    delay_menu.addAction(act_custom)
-
-    btn_delay_menu.setMenu(delay_menu)
-
-    delay_row = QtWidgets.QWidget()
-    hl = QtWidgets.QHBoxLayout(delay_row)
-    hl.setContentsMargins(0, 0, 0, 0)
-    hl.setSpacing(2)
-    hl.addWidget(delay)
-    hl.addWidget(btn_delay_menu)
-
-    nav_row = QtWidgets.QWidget()
-    nav_row_layout = QtWidgets.QHBoxLayout(nav_row)
-    nav_row_layout.setContentsMargins(0, 0, 0, 0)
-    nav_row_layout.setSpacing(2)
-    nav_row_layout.addWidget(btn_prev)
-    nav_row_layout.addWidget(btn_next)    
-    nav_row_layout.addWidget(chk_loop)
-    nav_row_layout.addWidget(btn_revision)
-
-    nav.add(nav_row)
-    delay_container = QtWidgets.QWidget()
-    delay_layout = QtWidgets.QHBoxLayout(delay_container)
-    delay_layout.setContentsMargins(0, 0, 0, 0)
-    delay_layout.setSpacing(2)
-
-    delay_lbl = QtWidgets.QLabel("Delay:")
-    delay_lbl.setStyleSheet(
-        "font-size: 11px; color: #222; background: transparent; border: none; padding: 0px;"
+        # Built on first use and reused; later opens only re-seed the value.
+        nonlocal custom_dlg
+        if custom_dlg is None:
+            custom_dlg = QtWidgets.QInputDialog(app)
+            custom_dlg.setInputMode(QtWidgets.QInputDialog.DoubleInput)
+            custom_dlg.setWindowTitle("Loop Delay")
+            custom_dlg.setLabelText("Seconds:")
+            custom_dlg.setDoubleRange(0.1, 60.0)
+            custom_dlg.setDoubleDecimals(1)
+        custom_dlg.setDoubleValue(app.loop_delay_sec)
+        if custom_dlg.exec_() == QtWidgets.QDialog.Accepted:
+            _set_delay(custom_dlg.doubleValue())
+
+    def _fill_delay_menu():
+        if not delay_menu.isEmpty():
+            return
+        delay_menu.setStyleSheet(_DELAY_MENU_QSS)
+        # Presets carry their value in data(); one menu-level slot handles them all.
+        for v in _DELAY_PRESETS:
+            act = QtWidgets.QAction(f"{v:.1f} s", delay_menu)
+            act.setData(v)
+            delay_menu.addAction(act)
+        delay_menu.addSeparator()
+        act_custom = QtWidgets.QAction("Custom.", delay_menu)
+        act_custom.triggered.connect(_custom_delay)
+        delay_menu.addAction(act_custom)
+
+    delay_menu.aboutToShow.connect(_fill_delay_menu)
+    delay_menu.triggered.connect(
+        lambda act: _set_delay(act.data()) if act.data() is not None else None
     )
-    delay_lbl.setAlignment(QtCore.Qt.AlignVCenter | QtCore.Qt.AlignLeft)
+    btn_delay_menu.setMenu(delay_menu)
 
-    delay_layout.addWidget(delay_lbl)
-    delay_layout.addWidget(delay_row)
+    nav.add(btn_prev, btn_next, chk_loop, btn_revision)
 
-    nav.add(delay_container)
+    nav.add(_small_label("Delay:"), delay, btn_delay_menu)
 
     ann = RibbonGroup("Annotation", 200)
 
     s_alpha = QtWidgets.QSlider(QtCore.Qt.Horizontal)
     s_alpha.setRange(0, 100)
     s_alpha.setValue(int(app.annotation_alpha * 100))
-    s_alpha.setStyleSheet("""
-        QSlider::groove:horizontal {
-            background: #d0d0d0;
-            height: 4px;
-            border-radius: 2px;
-        }
-        QSlider::sub-page:horizontal {
-            background: #8a8a8a;
-            height: 4px;
-            border-radius: 2px;
-        }
-        QSlider::add-page:horizontal {
-            background: #d0d0d0;
-            height: 4px;
-            border-radius: 2px;
-        }
-        QSlider::handle:horizontal {
-            background: #000000;
-            border: 1px solid #000000;
-            width: 10px;
-            height: 10px;
-            margin: -4px 0;
-            border-radius: 5px;
-        }
-    """)
+    s_alpha.setObjectName("ribbonSlider")
 
     lbl_alpha = QtWidgets.QLabel(f"{int(app.annotation_alpha * 100)}%")
     lbl_alpha.setFixedWidth(36)
     lbl_alpha.setAlignment(QtCore.Qt.AlignRight | QtCore.Qt.AlignVCenter)
 
-    s_alpha.valueChanged.connect(app._on_ribbon_alpha)
+    s_alpha.valueChanged.connect(_throttled(app._on_ribbon_alpha, s_alpha))
     ann.add_row("Alpha (A +/-)", s_alpha, lbl_alpha)
 
     s_brush = QtWidgets.QSlider(QtCore.Qt.Horizontal)
     s_brush.setRange(1, 200)
     s_brush.setValue(int(app.brush_size))
-    s_brush.setStyleSheet(s_alpha.styleSheet())
+    s_brush.setObjectName("ribbonSlider")
 
     lbl_brush = QtWidgets.QLabel(f"{int(app.brush_size)} px")
     lbl_brush.setFixedWidth(36)
     lbl_brush.setAlignment(QtCore.Qt.AlignRight | QtCore.Qt.AlignVCenter)
 
-    s_brush.valueChanged.connect(app._on_ribbon_brush)
+    s_brush.valueChanged.connect(_throttled(app._on_ribbon_brush, s_brush))
     ann.add_row("Brush (B +/-)", s_brush, lbl_brush)
 
     s_point = QtWidgets.QSlider(QtCore.Qt.Horizontal)
     s_point.setRange(1, 20)
     s_point.setValue(app.point_size)
-    s_point.setStyleSheet(s_alpha.styleSheet())
+    s_point.setObjectName("ribbonSlider")
 
     lbl_point = QtWidgets.QLabel(f"{app.point_size} px")
     lbl_point.setFixedWidth(36)
     lbl_point.setAlignment(QtCore.Qt.AlignRight | QtCore.Qt.AlignVCenter)
 
-    s_point.valueChanged.connect(app._on_ribbon_point)
+    s_point.valueChanged.connect(_throttled(app._on_ribbon_point, s_point))
     ann.add_row("Point (D +/-)", s_point, lbl_point)
 
     app.ribbon_sliders = {
@@ -323,115 +503,53 @@ def build_ribbon(app) -> QtWidgets.QWidget:
 
     col = RibbonGroup("Colors", 170)
 
-    swatches = QtWidgets.QWidget()
-    g = QtWidgets.QGridLayout(swatches)
-    g.setContentsMargins(0, 0, 0, 0)
-    g.setHorizontalSpacing(3)
-    g.setVerticalSpacing(3)
-
-    colors = [
-        "#FF0000", "#00FF00", "#0000FF", "#FFFF00",
-        "#00FFFF", "#FF00FF", "#FFA500", "#800080",
-        "#A52A2A", "#808080", "#000000", "#FFFFFF",
-        "#008080", "#000080", "#808000", "#FFC0CB",
-        "#C0C0C0", "#FFD700", "#4B0082", "#2E8B57",
-        "#DC143C", "#4682B4", "#9ACD32", "#8B4513",
-        "#7FFF00", "#00CED1", "#FF1493", "#708090", 
-        "#FFDAB9",
-    ]
+    swatches = SwatchGrid(_SWATCH_COLORS, _SWATCH_COLS)
+    swatches.swatchClicked.connect(app.select_swatch)
 
-    cols = 6
-    swatch_group = QtWidgets.QButtonGroup(col)
-    swatch_group.setExclusive(True)
-    for i, c in enumerate(colors):
-        b = QtWidgets.QPushButton()
-        b.setCheckable(True)
-        b.setAutoExclusive(False)
-        b.setFixedSize(16, 16)
-        b.setStyleSheet(f"""
-            QPushButton {{
-                background: {c};
-                border: 1px solid #777;
-                border-radius: 2px;
-            }}
-            QPushButton:checked {{
-                border: 3px solid #00E5FF;
-                padding: -1px;
-                background: {c};
-            }}
-            QPushButton:hover {{
-                border-color: #00E5FF;
-            }}
-        """)
-        swatch_group.addButton(b)
-        b.clicked.connect(lambda _, x=c: app.select_swatch(x))
-        g.addWidget(b, i // cols, i % cols)
-
-    pick_btn = QtWidgets.QPushButton()
-    pick_btn.setFixedSize(16,16)
+    pick_btn = QToolButton(swatches)
+    pick_btn.setFixedSize(16, 16)
     pick_btn.setToolTip("Pick color")
-    pick_btn.setFlat(True)
-    pick_btn.setAutoFillBackground(False)
-    pick_btn.setStyleSheet("""
-        QPushButton { border: 1px solid transparent; border-radius: 2px; }
-        QPushButton:hover { border-color: #777; }
-        QPushButton:pressed { border-color: #00E5FF; }
-    """)
-    icon_path = Path(__file__).resolve().parent.parent / "icons" / "color-pick.png"
-    if icon_path.exists():
-        pick_btn.setIcon(QIcon(str(icon_path)))
+    pick_btn.setAutoRaise(True)
+    pick_btn.setObjectName("swatchPick")
+    pick_icon = icon_color_pick(app)
+    if pick_icon is not None:
+        pick_btn.setIcon(pick_icon)
         pick_btn.setIconSize(QtCore.QSize(16, 16))
     pick_btn.clicked.connect(app.pick_color)
-    g.addWidget(pick_btn, len(colors) // cols, cols - 1)
+    pick_btn.move(swatches.cell_rect(len(_SWATCH_COLORS)).topLeft())
 
     col.add(swatches)
     edit = RibbonGroup("Edit", 130)
 
     chk_ann = _ribbon_button(app._icon_pencil(), "Annotation mode (A)", checkable=True)
-    chk_ann.setChecked(app.act_annotation_mode.isChecked())
-    chk_ann.toggled.connect(app.act_annotation_mode.setChecked)
-    app.act_annotation_mode.toggled.connect(chk_ann.setChecked)
+    _bind_action(chk_ann, app.act_annotation_mode)
 
     chk_eraser = _ribbon_button(app._icon_eraser(), "Eraser", checkable=True)
-    chk_eraser.setChecked(app.act_eraser.isChecked())
-    chk_eraser.toggled.connect(app.act_eraser.setChecked)
-    app.act_eraser.toggled.connect(chk_eraser.setChecked)
+    _bind_action(chk_eraser, app.act_eraser)
 
     chk_repair = _ribbon_button(app._icon_repair(), "Repair", checkable=True)
-    chk_repair.setChecked(app.act_repair.isChecked())
-    chk_repair.toggled.connect(app.act_repair.setChecked)
-    app.act_repair.toggled.connect(chk_repair.setChecked)
+    _bind_action(chk_repair, app.act_repair)
 
     chk_clone = _ribbon_button(app._icon_clone(), "Clone", checkable=True)
-    chk_clone.setChecked(app.act_clone.isChecked())
-    chk_clone.toggled.connect(app.act_clone.setChecked)
-    app.act_clone.toggled.connect(chk_clone.setChecked)
-
-    edit_row = QtWidgets.QWidget()
-    edit_row_layout = QtWidgets.QHBoxLayout(edit_row)
-    edit_row_layout.setContentsMargins(0, 0, 0, 0)
-    edit_row_layout.setSpacing(2)
-    edit_row_layout.addWidget(chk_ann)
-    edit_row_layout.addWidget(chk_eraser)
-    edit_row_layout.addWidget(chk_repair)
-    edit_row_layout.addWidget(chk_clone)
-    edit.add(edit_row)
+    _bind_action(chk_clone, app.act_clone)
+
+    edit.add(chk_ann, chk_eraser, chk_repair, chk_clone)
 
     enh = RibbonGroup("Enhancement", 195, title_position="bottom")
-    enh.setSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Fixed)
+    enh.setSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Preferred)
     enh.controls.setSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
     enh.grid.setAlignment(QtCore.Qt.AlignTop)
-    # Height alignment is handled after layout is assembled.
 
     s_gamma = QtWidgets.QSlider(QtCore.Qt.Horizontal)
     s_gamma.setRange(10, 300)
     s_gamma.setValue(100)
-    s_gamma.valueChanged.connect(app.on_gamma_change)
-    s_gamma.setStyleSheet(s_alpha.styleSheet())
+    app.ribbon_gamma_throttle = _throttled(app.on_gamma_change, s_gamma)
+    s_gamma.valueChanged.connect(app.ribbon_gamma_throttle)
+    s_gamma.setObjectName("ribbonSlider")
 
     app.ribbon_gamma_slider = s_gamma
     app.ribbon_gamma_label = QtWidgets.QLabel("1.00")
-    app.ribbon_gamma_label.setStyleSheet("font-size: 11px; color: #222;")
+    app.ribbon_gamma_label.setObjectName("ribbonValueLabel")
     app.ribbon_gamma_label.setAlignment(QtCore.Qt.AlignVCenter | QtCore.Qt.AlignRight)
 
     btn_auto = _ribbon_button(app._icon_contrast(), "Auto contrast", icon_size=16, button_size=24)
@@ -445,20 +563,12 @@ def build_ribbon(app) -> QtWidgets.QWidget:
 
     enh.add_row("Gamma (G +/-)", s_gamma, app.ribbon_gamma_label)
     app.ribbon_sliders["gamma"] = (s_gamma, app.ribbon_gamma_label)
-    enh_row = QtWidgets.QWidget()
-    enh_row_layout = QtWidgets.QHBoxLayout(enh_row)
-    enh_row_layout.setContentsMargins(0, 0, 0, 0)
-    enh_row_layout.setSpacing(4)
-    enh_row_layout.addWidget(btn_auto)
-    enh_row_layout.addWidget(btn_reset)
-    enh_row_layout.addWidget(btn_hist)
-    enh.add(enh_row)
+    enh.add(btn_auto, btn_reset, btn_hist, spacing=4)
 
     view = RibbonGroup("View", 195, title_position="bottom")
-    view.setSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Fixed)
+    view.setSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Preferred)
     view.controls.setSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
     view.grid.setAlignment(QtCore.Qt.AlignTop)
-    # Height alignment is handled after layout is assembled.
 
     btn_reset = _ribbon_button(app._icon_reset_view(), "Reset view (R)")
     btn_reset.clicked.connect(app.reset_view)
@@ -499,20 +609,9 @@ def build_ribbon(app) -> QtWidgets.QWidget:
 
     chk_toggle = _ribbon_button(app._icon_eye(), "Show annotations", checkable=True)
     app.toggle_ann_chk = chk_toggle
-    chk_toggle.setChecked(app.act_toggle_annotations.isChecked())
-    chk_toggle.toggled.connect(app.act_toggle_annotations.setChecked)
-    app.act_toggle_annotations.toggled.connect(chk_toggle.setChecked)
-
-    view_row = QtWidgets.QWidget()
-    view_row_layout = QtWidgets.QHBoxLayout(view_row)
-    view_row_layout.setContentsMargins(0, 0, 0, 0)
-    view_row_layout.setSpacing(4)
-    view_row_layout.addWidget(btn_reset)
-    view_row_layout.addWidget(btn_zoom_in)
-    view_row_layout.addWidget(btn_zoom_out)
-    view_row_layout.addWidget(chk_toggle)
-
-    view.add(view_row)
+    _bind_action(chk_toggle, app.act_toggle_annotations)
+
+    view.add(btn_reset, btn_zoom_in, btn_zoom_out, chk_toggle, spacing=4)
     spacer = QtWidgets.QWidget()
     spacer.setFixedHeight(4)
     view.add(spacer)
@@ -522,29 +621,10 @@ def build_ribbon(app) -> QtWidgets.QWidget:
     nav_edit_layout = QtWidgets.QVBoxLayout(nav_edit)
     nav_edit_layout.setContentsMargins(0, 0, 0, 0)
     nav_edit_layout.setSpacing(4)
-    nav_edit_layout.addWidget(nav)
-    nav_edit_layout.addWidget(edit)
-
-    h.addWidget(nav_edit, 0, QtCore.Qt.AlignTop)
-    for grp in (ann, col, enh, view):
-        h.addWidget(grp, 0, QtCore.Qt.AlignTop)
-
-    nav_edit.adjustSize()
-    target_height = max(
-        nav_edit.sizeHint().height(),
-        ann.sizeHint().height(),
-        col.sizeHint().height(),
-        enh.sizeHint().height(),
-        view.sizeHint().height(),
-    )
-    if target_height > 0:
-        nav_height = nav.sizeHint().height()
-        spacing = nav_edit_layout.spacing()
-        edit_height = max(0, target_height - nav_height - spacing)
-        edit.setFixedHeight(edit_height)
-        nav_edit.setFixedHeight(target_height)
-        for grp in (ann, col, enh, view):
-            grp.setFixedHeight(target_height)
-
-    h.addStretch(1)
-    return ribbon
+    nav_edit_layout.addWidget(nav, 0)
+    nav_edit_layout.addWidget(edit, 1)   # Edit takes whatever height Navigation leaves
+
+    for c, w in enumerate((nav_edit, ann, col, enh, view)):
+        h.addWidget(w, 0, c)
+    h.setRowStretch(1, 1)
+    h.setColumnStretch(5, 1)